@@ -114,8 +114,12 @@ class FileCourt:
         # Discover all files
         self.all_files = self._discover_files()
 
-        # Initialize agents
-        self.prosecutor = ProsecutorAgent(str(self.repo_root), self.all_files)
+        # Initialize agents. The persistent case cache is opt-in via
+        # environment variable, mirroring the AETHER_COMPILE knob
+        case_cache_dir = os.environ.get("AETHER_CASE_CACHE") or None
+        self.prosecutor = ProsecutorAgent(
+            str(self.repo_root), self.all_files, cache_dir=case_cache_dir
+        )
         self.defense = DefenseAgent(str(self.repo_root), self.all_files)
         self.judge = JudgeAgent(conservative_mode=conservative)
 
@@ -171,9 +175,8 @@ class FileCourt:
             print("🔍 INITIAL SCREENING - Identifying Suspects...")
             print("-" * 50)
 
-        for file_path in self.all_files:
-            case = self.prosecutor.prosecute(file_path)
-
+        cases = self.prosecutor.build_cases(self.all_files)
+        for file_path, case in zip(self.all_files, cases, strict=True):
             # File is suspicious if prosecutor confidence is above threshold
             if case.confidence >= threshold:
                 suspects.append(file_path)
@@ -12,14 +12,79 @@ Investigates:
 - Is it a partial/incomplete implementation?
 """
 
+import ast
+import concurrent.futures
+import contextlib
 import hashlib
+import itertools
+import json
 import os
-import re
+import sqlite3
+import sys
+import zlib
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
 
+try:
+    # The `regex` module is API-compatible and noticeably faster on the
+    # large-content scans below; fall back to stdlib `re` when absent
+    import regex as re
+except ImportError:
+    import re
 
-@dataclass
+
+# Per-worker agent with pre-built indices, set by the pool initializer
+_WORKER_AGENT = None
+
+
+def _stable_hash64(token: bytes) -> int:
+    """Seed-independent 64-bit token hash.
+
+    The builtin hash() is salted per interpreter run, so signatures
+    built from it (and the duplicate findings derived from them) would
+    flap between CI runs on an identical tree.
+    """
+    return int.from_bytes(hashlib.blake2b(token, digest_size=8).digest(), "little")
+
+
+def _worker_init(agent: "ProsecutorAgent"):
+    """Stash the pre-built agent in this worker process"""
+    global _WORKER_AGENT
+    _WORKER_AGENT = agent
+
+
+def _build_case_worker(file_path: str) -> "ProsecutionCase":
+    """Build one case using the worker's shared agent"""
+    return _WORKER_AGENT.build_case(file_path)
+
+
+def _literal_prefix(pattern: str) -> str:
+    """Extract the leading literal characters of a regex pattern.
+
+    Escaped punctuation counts as literal; the prefix stops at the first
+    real metacharacter (including escape classes like ``\\b``/``\\s``).
+    Returns "" when the pattern has no usable literal prefix.
+    """
+    prefix = []
+    i = 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == "\\":
+            nxt = pattern[i + 1] if i + 1 < len(pattern) else ""
+            if nxt and not nxt.isalnum():
+                prefix.append(nxt)
+                i += 2
+                continue
+            break
+        if ch in "^$.|?*+()[]{}":
+            break
+        prefix.append(ch)
+        i += 1
+    return "".join(prefix)
+
+
+@dataclass(slots=True)
 class Evidence:
     """A piece of evidence for/against a file"""
 
@@ -29,8 +94,14 @@ class Evidence:
     weight: float  # -1.0 to 1.0 (negative = keep, positive = quarantine)
     details: dict = field(default_factory=dict)
 
+    def __post_init__(self):
+        # These fields draw from small fixed vocabularies; interning
+        # collapses the thousands of instances onto shared strings
+        self.type = sys.intern(self.type)
+        self.severity = sys.intern(self.severity)
+
 
-@dataclass
+@dataclass(slots=True)
 class ProsecutionCase:
     """The prosecutor's case against a file"""
 
@@ -68,6 +139,78 @@ class ProsecutionCase:
         }
 
 
+class _CaseCache:
+    """Persistent cross-run cache of prosecution cases.
+
+    A small Bloom filter answers "was this file version analyzed before?"
+    in O(1) without touching sqlite for never-seen files; probable hits are
+    verified by exact key in the sqlite store, so false positives only cost
+    one lookup.
+    """
+
+    _BLOOM_BITS = 1 << 20  # 128 KB filter
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._bloom_path = self.cache_dir / "bloom.bin"
+        self._db = sqlite3.connect(self.cache_dir / "cases.sqlite")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS cases (key BLOB PRIMARY KEY, case_json TEXT)"
+        )
+
+        self._bloom = bytearray(self._BLOOM_BITS // 8)
+        self._dirty = False
+        try:
+            data = self._bloom_path.read_bytes()
+            if len(data) == len(self._bloom):
+                self._bloom = bytearray(data)
+        except OSError:
+            pass
+
+    def _bit_positions(self, key: bytes) -> list[int]:
+        # The key is already a uniform digest; carve it into four indexes
+        return [
+            int.from_bytes(key[i : i + 4], "little") % self._BLOOM_BITS
+            for i in range(0, 16, 4)
+        ]
+
+    def get(self, key: bytes) -> dict | None:
+        """Return the cached case dict for key, or None"""
+        for pos in self._bit_positions(key):
+            if not self._bloom[pos >> 3] & (1 << (pos & 7)):
+                return None
+
+        row = self._db.execute(
+            "SELECT case_json FROM cases WHERE key = ?", (key,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, key: bytes, case_dict: dict):
+        """Store a case dict under key; persistence happens in flush()"""
+        self._db.execute(
+            "INSERT OR REPLACE INTO cases (key, case_json) VALUES (?, ?)",
+            (key, json.dumps(case_dict)),
+        )
+        for pos in self._bit_positions(key):
+            self._bloom[pos >> 3] |= 1 << (pos & 7)
+        self._dirty = True
+
+    def flush(self):
+        """Commit pending rows and write the filter once per batch.
+
+        put() used to rewrite the full 128 KB bloom file on every call;
+        batching the persistence here makes a run of N puts one commit
+        and one file write.
+        """
+        if not self._dirty:
+            return
+        self._db.commit()
+        with contextlib.suppress(OSError):
+            self._bloom_path.write_bytes(self._bloom)
+        self._dirty = False
+
+
 class ProsecutorAgent:
     """
     The Prosecutor builds the case for removing files.
@@ -128,36 +271,129 @@ class ProsecutorAgent:
         r"skeleton",
     ]
 
-    def __init__(self, repo_root: str, all_files: list[str]):
+    # Old date references (years 2010-2022), compiled once
+    OLD_YEAR_RE = re.compile(r"\b20(1[0-9]|20|21|22)\b")
+
+    # Single alternations so content is scanned once per category instead of
+    # once per pattern; group index maps each match back to its source pattern
+    OBSOLETE_RE = re.compile(
+        "|".join(f"({p})" for p in OBSOLETE_PATTERNS), re.IGNORECASE
+    )
+    ABANDONMENT_RE = re.compile(
+        "|".join(f"({p})" for p in ABANDONMENT_MARKERS), re.IGNORECASE
+    )
+    INCOMPLETE_RE = re.compile(
+        "|".join(f"({p})" for p in INCOMPLETE_MARKERS), re.IGNORECASE
+    )
+
+    # Check pipeline, in execution order. The cheap checks that can
+    # produce instantly-decisive evidence (empty file, exact duplicate via
+    # the prebuilt index) run first so the early exit pays off
+    DEFAULT_CHECKS = (
+        "_check_size_anomalies",
+        "_check_duplicate_content",
+        "_check_orphan_status",
+        "_check_obsolete_naming",
+        "_check_abandonment_markers",
+        "_check_incomplete_implementation",
+        "_check_dead_code",
+        "_check_staleness",
+        "_check_location_anomalies",
+    )
+
+    # Data/markup files can't contain dead code, so those extensions skip
+    # the code-only checks entirely
+    DATA_EXTENSIONS = {".json", ".yaml", ".yml", ".toml", ".md", ".txt", ".cfg", ".ini"}
+    DATA_SKIPPED_CHECKS = {"_check_dead_code"}
+
+    # Lowercased literal prefixes per category: a handful of C-level
+    # substring scans decide whether the regex pass can be skipped entirely.
+    # An empty prefix (pattern with no literal lead) disables the gate.
+    OBSOLETE_PREFIXES = tuple({_literal_prefix(p).lower() for p in OBSOLETE_PATTERNS})
+    ABANDONMENT_PREFIXES = tuple(
+        {_literal_prefix(p).lower() for p in ABANDONMENT_MARKERS}
+    )
+    INCOMPLETE_PREFIXES = tuple({_literal_prefix(p).lower() for p in INCOMPLETE_MARKERS})
+
+    def __init__(
+        self, repo_root: str, all_files: list[str], cache_dir: str | None = None
+    ):
         """
         Initialize the Prosecutor Agent.
 
         Args:
             repo_root: Path to the repository root
             all_files: List of file paths relative to repo root
+            cache_dir: Optional directory for a persistent cross-run case
+                cache keyed by (path, mtime, size). Opt-in: cached cases can
+                go stale when *other* files change (e.g. orphan status), so
+                only enable it where that tradeoff is acceptable.
         """
         self.repo_path = Path(repo_root)
-        self.all_files = all_files
-        self.all_file_paths = set(all_files)
-        self.file_contents: dict[str, str] = {}
-
-        # Build stem index for efficient module resolution
+        self._case_cache = _CaseCache(cache_dir) if cache_dir else None
+
+        # Per-extension check dispatch, bound once
+        self._default_checks = tuple(getattr(self, n) for n in self.DEFAULT_CHECKS)
+        data_checks = tuple(
+            getattr(self, n)
+            for n in self.DEFAULT_CHECKS
+            if n not in self.DATA_SKIPPED_CHECKS
+        )
+        self._dispatch = dict.fromkeys(self.DATA_EXTENSIONS, data_checks)
+        # Intern paths so the list, set and index buckets share one string each
+        self.all_files = [sys.intern(f) for f in all_files]
+        self.all_file_paths = set(self.all_files)
+        # Bounded LRU of file contents - keeps the working set hot without
+        # pinning every large file in memory for the agent's lifetime
+        self.file_contents: OrderedDict[str, str] = OrderedDict()
+        self._word_bitsets: dict[str, int] = {}
+
+        # Build stem index for efficient module resolution, and cache stat
+        # sizes so similarity candidates can be rejected without opening
+        # the file
         self.stem_to_files: dict[str, list[str]] = {}
-        for f in all_files:
+        self.sizes: dict[str, int] = {}
+        for f in self.all_files:
             stem = Path(f).stem
             if stem not in self.stem_to_files:
                 self.stem_to_files[stem] = []
             self.stem_to_files[stem].append(f)
 
+            with contextlib.suppress(OSError):
+                self.sizes[f] = (self.repo_path / f).stat().st_size
+
         # Build reference graphs for orphan detection
         self.dep_graph: dict[str, set[str]] = {}
         self.reverse_graph: dict[str, set[str]] = {}
         self._build_reference_graphs()
 
-        # Build content hashes for duplicate detection
-        self.content_hashes: dict[str, list[str]] = {}
+        # Build content hashes and SimHash signatures for duplicate detection.
+        # Hash keys are (normalized_length, 64-bit digest int) so only
+        # same-size candidates can ever collide; integer keys also hash
+        # faster than hex strings in the index dicts.
+        self.content_hashes: dict[tuple[int, int], list[str]] = {}
+        self.hash_keys: dict[str, tuple[int, int]] = {}
+        self.simhashes: dict[str, int] = {}
+        # Per-file (non_empty_lines, code_lines), counted during the same
+        # streaming pass so checks never rebuild line lists from content
+        self.line_stats: dict[str, tuple[int, int]] = {}
         self._build_content_hashes()
 
+        # LSH-style band index over the SimHash signatures: each 64-bit
+        # signature is cut into eight 8-bit bands, and files sharing any
+        # band bucket are near-duplicate candidates. Any pair within the
+        # Hamming threshold (< 8 differing bits) must share at least one
+        # identical band (pigeonhole), so querying the bands returns every
+        # pair the distance filter could accept - in sub-linear time.
+        self.simhash_bands: dict[tuple[str, int, int], list[str]] = {}
+        for path, simhash in self.simhashes.items():
+            suffix = Path(path).suffix
+            for band in range(8):
+                key = (suffix, band, (simhash >> (band * 8)) & 0xFF)
+                if key not in self.simhash_bands:
+                    self.simhash_bands[key] = []
+                self.simhash_bands[key].append(path)
+
     def _build_reference_graphs(self):
         """Build import/reference graphs from file contents"""
         for file_path in self.all_files:
@@ -188,8 +424,11 @@ class ProsecutorAgent:
                     if module_path in self.all_file_paths:
                         imports.add(module_path)
 
-            elif ext in {".js", ".ts", ".jsx", ".tsx"}:
-                # JavaScript imports
+            elif ext in {".js", ".ts", ".jsx", ".tsx"} and (
+                "import" in content or "require" in content
+            ):
+                # JavaScript imports (the literal substring check above skips
+                # the three regex passes on files with no import syntax at all)
                 patterns = [
                     r'require\s*\(\s*[\'"]([^\'"]+)[\'"]\s*\)',
                     r'import\s+.*?\s+from\s+[\'"]([^\'"]+)[\'"]',
@@ -217,51 +456,194 @@ class ProsecutorAgent:
                     self.reverse_graph[imp] = set()
                 self.reverse_graph[imp].add(file_path)
 
+    # Chunk size for streaming file hashing
+    _HASH_CHUNK_SIZE = 65536
+
     def _build_content_hashes(self):
-        """Build hash index for duplicate detection"""
+        """Build hash and SimHash indexes for duplicate detection"""
         for file_path in self.all_files:
             try:
-                content = self._get_content(file_path)
-                if content:
-                    # Normalize whitespace for comparison
-                    normalized = re.sub(r"\s+", " ", content.strip())
-                    content_hash = hashlib.md5(normalized.encode()).hexdigest()
-
-                    if content_hash not in self.content_hashes:
-                        self.content_hashes[content_hash] = []
-                    self.content_hashes[content_hash].append(file_path)
+                signatures = self._stream_signatures(file_path)
+                if signatures:
+                    hash_key, simhash = signatures
+
+                    self.hash_keys[file_path] = hash_key
+                    if hash_key not in self.content_hashes:
+                        self.content_hashes[hash_key] = []
+                    self.content_hashes[hash_key].append(file_path)
+
+                    self.simhashes[file_path] = simhash
             except Exception:
                 pass
 
+    def _stream_signatures(self, rel_path: str) -> tuple[tuple[int, int], int] | None:
+        """Stream a file once in binary chunks, computing both signatures.
+
+        Returns ((normalized_length, blake2b_64bit_digest), simhash), or None
+        for empty or unreadable files. Whitespace runs collapse to single
+        spaces as the stream is fed to BLAKE2b (faster than MD5, and no
+        full normalized copy of the content is ever materialized). The same
+        pass feeds per-token hash votes into the 64-bit SimHash used to
+        pre-filter near-duplicate candidates without file I/O.
+        """
+        digest = hashlib.blake2b(digest_size=8)
+        votes = [0] * 64
+        norm_len = 0
+        first = True
+
+        def emit(token: bytes):
+            nonlocal norm_len, first
+            if first:
+                first = False
+            else:
+                digest.update(b" ")
+                norm_len += 1
+            digest.update(token)
+            norm_len += len(token)
+            h = _stable_hash64(token.lower())
+            for bit in range(64):
+                if (h >> bit) & 1:
+                    votes[bit] += 1
+                else:
+                    votes[bit] -= 1
+
+        non_empty_lines = 0
+        code_lines = 0
+
+        def emit_line(line: bytes):
+            nonlocal non_empty_lines, code_lines
+            stripped = line.strip()
+            if stripped:
+                non_empty_lines += 1
+                if not stripped.startswith(b"#"):
+                    code_lines += 1
+            for token in stripped.split():
+                emit(token)
+
+        carry = b""
+        try:
+            with open(self.repo_path / rel_path, "rb") as f:
+                while chunk := f.read(self._HASH_CHUNK_SIZE):
+                    if carry:
+                        chunk = carry + chunk
+                    lines = chunk.split(b"\n")
+                    # The last piece may be a partial line; hold it back
+                    carry = lines.pop()
+                    for line in lines:
+                        emit_line(line)
+        except OSError:
+            return None
+
+        if carry:
+            emit_line(carry)
+        self.line_stats[rel_path] = (non_empty_lines, code_lines)
+        if first:
+            # Empty or whitespace-only file - no signature
+            return None
+
+        simhash = 0
+        for bit, vote in enumerate(votes):
+            if vote > 0:
+                simhash |= 1 << bit
+        return (norm_len, int.from_bytes(digest.digest(), "little")), simhash
+
+    # How many file contents stay cached; memory stays O(working set)
+    # instead of O(repo)
+    _CONTENT_CACHE_SIZE = 64
+
+    # Files above this size are excluded from the near-duplicate pass
+    # (unlikely duplicates by this heuristic, expensive to tokenize)
+    _NEAR_DUP_MAX_SIZE = 2 * 1024 * 1024
+
     def _get_content(self, rel_path: str) -> str | None:
-        """Get file content, from cache or disk"""
-        if rel_path in self.file_contents:
-            return self.file_contents[rel_path]
+        """Get file content, from the bounded LRU cache or disk"""
+        cached = self.file_contents.get(rel_path)
+        if cached is not None:
+            self.file_contents.move_to_end(rel_path)
+            return cached
 
         try:
             full_path = self.repo_path / rel_path
             with open(full_path, encoding="utf-8", errors="ignore") as f:
                 content = f.read()
-                self.file_contents[rel_path] = content
-                return content
         except Exception:
             return None
 
+        self.file_contents[rel_path] = content
+        if len(self.file_contents) > self._CONTENT_CACHE_SIZE:
+            self.file_contents.popitem(last=False)
+        return content
+
+    def __getstate__(self):
+        # The sqlite-backed cache can't cross process boundaries; workers
+        # run uncached and the parent stores their results
+        state = self.__dict__.copy()
+        state["_case_cache"] = None
+        return state
+
+    def _cache_key(self, rel_path: str) -> bytes | None:
+        """Cache key identifying this exact file version"""
+        try:
+            st = (self.repo_path / rel_path).stat()
+        except OSError:
+            return None
+        return hashlib.blake2b(
+            f"{rel_path}|{st.st_mtime_ns}|{st.st_size}".encode(), digest_size=16
+        ).digest()
+
+    @staticmethod
+    def _case_from_dict(data: dict) -> ProsecutionCase:
+        """Rebuild a ProsecutionCase from its to_dict() form"""
+        return ProsecutionCase(
+            file_path=data["file_path"],
+            charges=data["charges"],
+            evidence=[Evidence(**e) for e in data["evidence"]],
+            prosecution_score=data["prosecution_score"],
+            summary=data["summary"],
+            recommended_action=data["recommended_action"],
+            verdict=data["verdict"],
+            confidence=data["confidence"],
+            argument=data["argument"],
+        )
+
     def build_case(self, file_path: str) -> ProsecutionCase:
         """Build the prosecution case against a file"""
+        cache_key = None
+        if self._case_cache is not None:
+            cache_key = self._cache_key(file_path)
+            if cache_key:
+                cached = self._case_cache.get(cache_key)
+                if cached is not None:
+                    return self._case_from_dict(cached)
+
         case = ProsecutionCase(file_path=file_path)
 
-        # Gather all evidence
-        self._check_orphan_status(file_path, case)
-        self._check_duplicate_content(file_path, case)
-        self._check_obsolete_naming(file_path, case)
-        self._check_abandonment_markers(file_path, case)
-        self._check_incomplete_implementation(file_path, case)
-        self._check_dead_code(file_path, case)
-        self._check_size_anomalies(file_path, case)
-        self._check_staleness(file_path, case)
-        self._check_location_anomalies(file_path, case)
+        # Gather evidence, running only the checks relevant to this file's
+        # extension. Once a critical weight>=0.9 finding lands AND the
+        # accumulated score already clears the quarantine threshold, the
+        # remaining scans can't change the verdict (scores only grow with
+        # more evidence) and are skipped.
+        ext = Path(file_path).suffix.lower()
+        for check in self._dispatch.get(ext, self._default_checks):
+            check(file_path, case)
+            if case.evidence:
+                last = case.evidence[-1]
+                if (
+                    last.weight >= 0.9
+                    and last.severity == "critical"
+                    and self._calculate_score(case) >= 70
+                ):
+                    break
+
+        self._finalize(case)
+
+        if self._case_cache is not None and cache_key:
+            self._case_cache.put(cache_key, case.to_dict())
+
+        return case
 
+    def _finalize(self, case: ProsecutionCase):
+        """Score the gathered evidence and fill in the verdict fields"""
         # Calculate prosecution score
         case.prosecution_score = self._calculate_score(case)
 
@@ -286,7 +668,53 @@ class ProsecutorAgent:
         case.summary = self._build_summary(case)
         case.argument = self._build_argument(case)
 
-        return case
+    def build_cases(self, paths: list[str]) -> list[ProsecutionCase]:
+        """Build prosecution cases for many files in parallel.
+
+        Each case is independent once the indices are built, so this fans
+        out across a process pool; workers receive the pre-built agent via
+        the pool initializer. Small batches take the serial path where
+        process startup would dominate.
+        """
+        # Serve warm entries from the persistent cache; only misses fan out
+        results: dict[str, ProsecutionCase] = {}
+        cache_keys: dict[str, bytes] = {}
+        misses = []
+        if self._case_cache is not None:
+            for path in paths:
+                key = self._cache_key(path)
+                cached = self._case_cache.get(key) if key else None
+                if cached is not None:
+                    results[path] = self._case_from_dict(cached)
+                    continue
+                if key:
+                    cache_keys[path] = key
+                misses.append(path)
+        else:
+            misses = list(paths)
+
+        parallel = len(misses) >= 8
+        if parallel:
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                initializer=_worker_init,
+                initargs=(self,),
+            ) as executor:
+                computed = list(executor.map(_build_case_worker, misses, chunksize=32))
+        else:
+            # build_case stores its own results in the cache on this path
+            computed = [self.build_case(p) for p in misses]
+
+        for path, case in zip(misses, computed, strict=True):
+            results[path] = case
+            # Workers run uncached, so the parent stores their results
+            if parallel and self._case_cache is not None and path in cache_keys:
+                self._case_cache.put(cache_keys[path], case.to_dict())
+
+        if self._case_cache is not None:
+            self._case_cache.flush()
+
+        return [results[p] for p in paths]
 
     def prosecute(self, file_path: str) -> ProsecutionCase:
         """
@@ -294,7 +722,10 @@ class ProsecutorAgent:
 
         This is the main entry point used by FileCourt.
         """
-        return self.build_case(file_path)
+        case = self.build_case(file_path)
+        if self._case_cache is not None:
+            self._case_cache.flush()
+        return case
 
     def _build_argument(self, case: ProsecutionCase) -> str:
         """Build a compelling prosecution argument"""
@@ -373,10 +804,8 @@ class ProsecutorAgent:
         if not content:
             return
 
-        normalized = re.sub(r"\s+", " ", content.strip())
-        content_hash = hashlib.md5(normalized.encode()).hexdigest()
-
-        duplicates = self.content_hashes.get(content_hash, [])
+        hash_key = self.hash_keys.get(file_path)
+        duplicates = self.content_hashes.get(hash_key, []) if hash_key else []
         other_duplicates = [d for d in duplicates if d != file_path]
 
         if other_duplicates:
@@ -386,52 +815,118 @@ class ProsecutorAgent:
                     description=f"Exact duplicate of: {', '.join(other_duplicates)}",
                     severity="critical",
                     weight=0.9,
-                    details={"duplicates": other_duplicates, "hash": content_hash},
+                    details={"duplicates": other_duplicates, "hash": hash_key[1]},
                 )
             )
 
-        # Check for near-duplicates (similar size, same extension)
-        file_size = len(content)
-        for other_path in self.all_file_paths:
+        # Check for near-duplicates (similar size, same extension). Query
+        # the SimHash band index: only files sharing at least one signature
+        # band are candidates, so the scan never touches clearly-dissimilar
+        # files.
+        file_size = self.sizes.get(file_path, len(content))
+        if file_size > self._NEAR_DUP_MAX_SIZE:
+            return
+        simhash = self.simhashes.get(file_path)
+        if simhash is None:
+            return
+        suffix = Path(file_path).suffix
+        candidates: list[str] = []
+        seen: set[str] = set()
+        for band in range(8):
+            key = (suffix, band, (simhash >> (band * 8)) & 0xFF)
+            for candidate in self.simhash_bands.get(key, []):
+                if candidate not in seen:
+                    seen.add(candidate)
+                    candidates.append(candidate)
+        for other_path in candidates:
             if other_path == file_path:
                 continue
-            if Path(other_path).suffix != Path(file_path).suffix:
+
+            # Within 10% size, using cached stat sizes - candidates outside
+            # the tolerance are rejected without any file I/O
+            other_size = self.sizes.get(other_path)
+            if other_size is None:
+                continue
+            if abs(file_size - other_size) / max(file_size, other_size, 1) >= 0.1:
                 continue
 
-            other_content = self._get_content(other_path)
-            if not other_content:
+            # Exact duplicates were already reported via the hash index
+            if hash_key is not None and self.hash_keys.get(other_path) == hash_key:
                 continue
 
-            other_size = len(other_content)
-            # Within 10% size and same extension
-            if abs(file_size - other_size) / max(file_size, other_size, 1) < 0.1:
-                # Check content similarity
-                similarity = self._calculate_similarity(content, other_content)
-                if similarity > 0.85:
-                    case.evidence.append(
-                        Evidence(
-                            type="near_duplicate",
-                            description=f"Very similar ({similarity*100:.0f}%) to: {other_path}",
-                            severity="major",
-                            weight=0.7,
-                            details={
-                                "similar_to": other_path,
-                                "similarity": similarity,
-                            },
-                        )
+            # Cheap SimHash pre-filter: skip the pair unless the signatures
+            # predict high similarity (distance < 8)
+            other_simhash = self.simhashes.get(other_path)
+            if (
+                other_simhash is not None
+                and (simhash ^ other_simhash).bit_count() >= 8
+            ):
+                continue
+
+            # Check content similarity (word sets are read and cached
+            # lazily inside the similarity helper)
+            similarity = self._calculate_similarity(file_path, other_path)
+            if similarity > 0.85:
+                case.evidence.append(
+                    Evidence(
+                        type="near_duplicate",
+                        description=f"Very similar ({similarity*100:.0f}%) to: {other_path}",
+                        severity="major",
+                        weight=0.7,
+                        details={
+                            "similar_to": other_path,
+                            "similarity": similarity,
+                        },
                     )
-                    break  # Only report one
+                )
+                break  # Only report one
 
-    def _calculate_similarity(self, content1: str, content2: str) -> float:
-        """Calculate Jaccard similarity between two texts"""
-        words1 = set(re.findall(r"\w+", content1.lower()))
-        words2 = set(re.findall(r"\w+", content2.lower()))
+    # Width of the hashed-token bitsets used for Jaccard estimation
+    _BITSET_BITS = 1 << 16
+
+    def _word_bitset(self, rel_path: str) -> int:
+        """Get the file's hashed-token bitset, tokenizing at most once.
+
+        Each word sets one bit (by hash) in a fixed-width bitset held as a
+        Python big int, so vocabulary comparison is bitwise arithmetic
+        rather than per-string set operations.
+        """
+        cached = self._word_bitsets.get(rel_path)
+        if cached is not None:
+            return cached
+
+        bitset = 0
+        content = self._get_content(rel_path)
+        if content:
+            bits = bytearray(self._BITSET_BITS // 8)
+            mask = self._BITSET_BITS - 1
+            # crc32 rather than the salted builtin hash() so the bitsets
+            # (and the similarity scores built on them) are stable
+            # across interpreter runs
+            crc32 = zlib.crc32
+            for word in re.findall(r"\w+", content.lower()):
+                bit = crc32(word.encode()) & mask
+                bits[bit >> 3] |= 1 << (bit & 7)
+            bitset = int.from_bytes(bits, "little")
+
+        self._word_bitsets[rel_path] = bitset
+        return bitset
+
+    def _calculate_similarity(self, path1: str, path2: str) -> float:
+        """Estimate Jaccard similarity between two files' vocabularies.
+
+        Operates on cached hashed-token bitsets: the intersection and union
+        are big-int AND/OR plus popcount, all C-level regardless of how
+        many words the files contain.
+        """
+        bits1 = self._word_bitset(path1)
+        bits2 = self._word_bitset(path2)
 
-        if not words1 or not words2:
+        if not bits1 or not bits2:
             return 0.0
 
-        intersection = len(words1 & words2)
-        union = len(words1 | words2)
+        intersection = (bits1 & bits2).bit_count()
+        union = (bits1 | bits2).bit_count()
 
         return intersection / union if union > 0 else 0.0
 
@@ -439,30 +934,40 @@ class ProsecutorAgent:
         """Check if filename suggests obsolescence"""
         file_name = Path(file_path).name.lower()
 
-        for pattern in self.OBSOLETE_PATTERNS:
-            if re.search(pattern, file_name, re.IGNORECASE):
-                case.evidence.append(
-                    Evidence(
-                        type="obsolete_name",
-                        description=f"Filename contains obsolete marker: {pattern}",
-                        severity="major",
-                        weight=0.7,
-                        details={"pattern": pattern, "filename": file_name},
-                    )
+        # Literal fast-path: most filenames contain none of the marker
+        # literals, so reject them with substring scans before the regex
+        if not self._contains_any(file_name, self.OBSOLETE_PREFIXES):
+            return
+
+        match = self.OBSOLETE_RE.search(file_name)
+        if match and match.lastindex:
+            pattern = self.OBSOLETE_PATTERNS[match.lastindex - 1]
+            case.evidence.append(
+                Evidence(
+                    type="obsolete_name",
+                    description=f"Filename contains obsolete marker: {pattern}",
+                    severity="major",
+                    weight=0.7,
+                    details={"pattern": pattern, "filename": file_name},
                 )
-                return  # One is enough
+            )
 
     def _check_abandonment_markers(self, file_path: str, case: ProsecutionCase):
         """Check content for abandonment markers"""
         content = self._get_content(file_path)
-        if not content:
+        if not content or not self._contains_any(content, self.ABANDONMENT_PREFIXES):
             return
 
+        # One pass over the content; tally by group to keep the
+        # 2-matches-per-pattern limit
         found_markers = []
-        for pattern in self.ABANDONMENT_MARKERS:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            if matches:
-                found_markers.extend(matches[:2])  # Limit to 2 per pattern
+        per_pattern: dict[int, int] = {}
+        for match in self.ABANDONMENT_RE.finditer(content):
+            group = match.lastindex or 0
+            seen = per_pattern.get(group, 0)
+            if seen < 2:
+                found_markers.append(match.group(0))
+            per_pattern[group] = seen + 1
 
         if found_markers:
             case.evidence.append(
@@ -475,39 +980,57 @@ class ProsecutorAgent:
                 )
             )
 
+    @staticmethod
+    def _contains_any(content: str, prefixes: tuple[str, ...]) -> bool:
+        """Literal pre-filter: do any of the marker prefixes occur at all?
+
+        A few C-level substring scans are far cheaper than a full regex pass
+        on files that contain none of the markers (the common case).
+        """
+        lowered = content.lower()
+        return any(prefix in lowered for prefix in prefixes)
+
+    def _count_markers(self, content: str) -> tuple[int, list[str]]:
+        """Count incomplete markers in a single pass.
+
+        Returns (marker_count, matched_patterns). Uses the combined
+        INCOMPLETE_RE alternation so the content is scanned once instead of
+        once per marker pattern.
+        """
+        incomplete_count = 0
+        found_groups: set[int] = set()
+        for match in self.INCOMPLETE_RE.finditer(content):
+            incomplete_count += 1
+            if match.lastindex:
+                found_groups.add(match.lastindex)
+
+        found_markers = [self.INCOMPLETE_MARKERS[i - 1] for i in sorted(found_groups)]
+        return incomplete_count, found_markers
+
     def _check_incomplete_implementation(self, file_path: str, case: ProsecutionCase):
         """Check for incomplete/stub implementations"""
         content = self._get_content(file_path)
-        if not content:
+        if not content or not self._contains_any(content, self.INCOMPLETE_PREFIXES):
             return
 
-        # Count incomplete markers
-        incomplete_count = 0
-        found_markers = []
-
-        for pattern in self.INCOMPLETE_MARKERS:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            incomplete_count += len(matches)
-            if matches:
-                found_markers.append(pattern)
-
-        # Check ratio of incomplete markers to code
-        lines = content.split("\n")
-        code_lines = [l for l in lines if l.strip() and not l.strip().startswith("#")]
+        # Markers from a single regex pass; line counts were tallied during
+        # the streaming signature pass
+        incomplete_count, found_markers = self._count_markers(content)
+        _, code_lines = self.line_stats.get(file_path, (0, 0))
 
         if code_lines and incomplete_count > 0:
-            ratio = incomplete_count / len(code_lines)
+            ratio = incomplete_count / code_lines
 
             if ratio > 0.1:  # More than 10% incomplete markers
                 case.evidence.append(
                     Evidence(
                         type="incomplete",
-                        description=f"High incomplete marker ratio ({ratio*100:.1f}%): {incomplete_count} markers in {len(code_lines)} lines",
+                        description=f"High incomplete marker ratio ({ratio*100:.1f}%): {incomplete_count} markers in {code_lines} lines",
                         severity="major",
                         weight=0.5,
                         details={
                             "markers_found": incomplete_count,
-                            "code_lines": len(code_lines),
+                            "code_lines": code_lines,
                             "patterns": found_markers,
                         },
                     )
@@ -532,18 +1055,34 @@ class ProsecutorAgent:
         ext = Path(file_path).suffix.lower()
 
         if ext == ".py":
-            # Check for functions/classes that are defined but never called
-            func_defs = re.findall(r"def\s+(\w+)\s*\(", content)
-            class_defs = re.findall(r"class\s+(\w+)\s*[\(:]", content)
-
-            # Check if these are used elsewhere in the repo
+            # Check for private functions that are defined but never used.
+            # A single AST pass collects definitions and references, instead
+            # of one regex sweep over the whole file per function - and it
+            # won't false-match names inside strings or comments.
             unused_funcs = []
-            for func in func_defs:
-                if func.startswith("_") and not func.startswith("__"):
-                    # Private function - check if used in same file
-                    usage_count = len(re.findall(r"\b" + func + r"\s*\(", content)) - 1
-                    if usage_count == 0:
-                        unused_funcs.append(func)
+            try:
+                tree = ast.parse(content)
+            except Exception:
+                tree = None
+
+            if tree is not None:
+                defs: set[str] = set()
+                uses: set[str] = set()
+                for node in ast.walk(tree):
+                    if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
+                        defs.add(node.name)
+                    elif isinstance(node, ast.Name):
+                        uses.add(node.id)
+                    elif isinstance(node, ast.Attribute):
+                        uses.add(node.attr)
+
+                unused_funcs = [
+                    func
+                    for func in defs
+                    if func.startswith("_")
+                    and not func.startswith("__")
+                    and func not in uses
+                ]
 
             if len(unused_funcs) > 3:
                 case.evidence.append(
@@ -582,25 +1121,13 @@ class ProsecutorAgent:
 
     def _check_size_anomalies(self, file_path: str, case: ProsecutionCase):
         """Check for size anomalies (too small to be useful)"""
-        content = self._get_content(file_path)
-        if not content:
+        stats = self.line_stats.get(file_path)
+        if stats is None:
             return
+        non_empty_lines = stats[0]
 
-        lines = [l for l in content.split("\n") if l.strip()]
-
-        # Very small files (might be stubs)
-        if len(lines) < 5:
-            case.evidence.append(
-                Evidence(
-                    type="tiny_file",
-                    description=f"Very small file with only {len(lines)} non-empty lines",
-                    severity="minor",
-                    weight=0.3,
-                    details={"lines": len(lines)},
-                )
-            )
         # Empty or near-empty
-        elif len(lines) == 0:
+        if non_empty_lines == 0:
             case.evidence.append(
                 Evidence(
                     type="empty_file",
@@ -610,6 +1137,17 @@ class ProsecutorAgent:
                     details={"lines": 0},
                 )
             )
+        # Very small files (might be stubs)
+        elif non_empty_lines < 5:
+            case.evidence.append(
+                Evidence(
+                    type="tiny_file",
+                    description=f"Very small file with only {non_empty_lines} non-empty lines",
+                    severity="minor",
+                    weight=0.3,
+                    details={"lines": non_empty_lines},
+                )
+            )
 
     def _check_staleness(self, file_path: str, case: ProsecutionCase):
         """Check if file appears stale based on content patterns"""
@@ -617,9 +1155,11 @@ class ProsecutorAgent:
         if not content:
             return
 
-        # Check for old date references
-        old_year_pattern = r"\b20(1[0-9]|20|21|22)\b"  # Years 2010-2022
-        old_years = re.findall(old_year_pattern, content)
+        # Check for old date references; only need to know whether there are
+        # more than 3, so keep a few samples and stop scanning at the 4th hit
+        # instead of materializing every match
+        matches = itertools.islice(self.OLD_YEAR_RE.finditer(content), 4)
+        old_years = [m.group(1) for m in matches]
 
         if len(old_years) > 3:
             case.evidence.append(
@@ -668,16 +1208,19 @@ class ProsecutorAgent:
         if not case.evidence:
             return 0.0
 
-        # Weighted sum of evidence
-        total_weight = sum(max(0, e.weight) for e in case.evidence)
-
-        # Apply severity multipliers
-        severity_multiplier = 1.0
+        # Weighted sum and severity multiplier in one pass over the evidence
+        total_weight = 0.0
+        has_critical = False
+        has_major = False
         for e in case.evidence:
+            if e.weight > 0:
+                total_weight += e.weight
             if e.severity == "critical":
-                severity_multiplier = max(severity_multiplier, 1.5)
+                has_critical = True
             elif e.severity == "major":
-                severity_multiplier = max(severity_multiplier, 1.2)
+                has_major = True
+
+        severity_multiplier = 1.5 if has_critical else 1.2 if has_major else 1.0
 
         score = min(100, total_weight * 40 * severity_multiplier)
         return round(score, 1)
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Optional AOT Compilation of Hot Analysis Modules
+Compiles the call-heavy analysis modules to C extensions with mypyc.
+
+The compiled extensions land next to their source files, where the
+import system prefers them over the .py, so they take over transparently
+and typically run 2-5x faster on the tight loops in the dependency
+graph walkers. Entirely optional: when mypy/mypyc is not installed this
+script is a no-op and the interpreted modules keep working unchanged.
+
+Part of AetherCore Repository Cleanup System
+"""
+
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+# Modules worth compiling: tight loops and heavy per-call overhead
+HOT_MODULES = [
+    ".github/workflows/scripts/dependency_graph.py",
+]
+
+
+def _compile_module(module: Path, config: Path) -> bool:
+    """Compile one module in place; returns True on success.
+
+    mypyc runs with the module's directory as cwd so the extension is
+    written next to the source (where it shadows the .py on import).
+    The repo mypy config is passed explicitly since mypy only discovers
+    config in the cwd, and --explicit-package-bases keeps mypyc from
+    guessing a package name for the un-packaged scripts directory.
+    """
+    cmd = [
+        sys.executable,
+        "-m",
+        "mypyc",
+        "--explicit-package-bases",
+        f"--config-file={config}",
+        module.name,
+    ]
+    result = subprocess.run(cmd, cwd=module.parent)
+    # The C build tree is an intermediate; the .so has been copied out
+    shutil.rmtree(module.parent / "build", ignore_errors=True)
+    return result.returncode == 0
+
+
+def _compiled_import_wins(module: Path) -> bool:
+    """Check that importing the module now loads the C extension"""
+    probe = (
+        f"import {module.stem} as m; import sys; "
+        f"sys.exit(0 if m.__file__.endswith('.so') else 1)"
+    )
+    result = subprocess.run([sys.executable, "-c", probe], cwd=module.parent)
+    return result.returncode == 0
+
+
+def main() -> int:
+    try:
+        import mypyc  # noqa: F401
+    except ImportError:
+        print("mypyc not installed; skipping AOT compilation")
+        return 0
+
+    config = Path("pyproject.toml").resolve()
+    if not config.exists():
+        print("pyproject.toml not found (run from the repo root); skipping")
+        return 0
+
+    for name in HOT_MODULES:
+        module = Path(name)
+        if not module.exists():
+            print(f"Skipping {module}: not found (run from the repo root)")
+            continue
+
+        print(f"Compiling {module} with mypyc...")
+        if not _compile_module(module, config):
+            # Fail soft - the interpreted module still works
+            print(f"mypyc failed for {module}; continuing uncompiled")
+            continue
+
+        if _compiled_import_wins(module):
+            print(f"Compiled {module.stem} active")
+        else:
+            print(f"Compiled {module.stem} built but not preferred on import")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,300 +7,603 @@ Part of AetherCore Repository Cleanup System
 """
 
 import ast
+import hashlib
 import logging
+import mmap
+import os
+import pickle
 import re
-from collections import defaultdict
+import sqlite3
+import sys
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import chain
 from pathlib import Path
+from typing import Any
 
 logger = logging.getLogger(__name__)
 
-
-class DependencyGraphBuilder:
-    """
-    Builds dependency graphs by analyzing code imports and references.
-    Supports Python, JavaScript/TypeScript, and config file references.
+# Relative paths recur as graph keys and set members across thousands of
+# sets; interning collapses the duplicates to one object apiece and lets
+# comparisons take the pointer-equality fast path
+_intern = sys.intern
+
+# Prefer the C-backed parsers when available: libyaml's CSafeLoader and
+# orjson parse config files several times faster than their pure-Python
+# counterparts, and both are drop-in for our read-only use
+try:
+    import yaml
+
+    try:
+        from yaml import CSafeLoader as _YamlLoader
+    except ImportError:
+        from yaml import SafeLoader as _YamlLoader
+except ImportError:
+    yaml = None
+
+_json_loads: Callable[[bytes], Any]
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+
+    _json_loads = json.loads
+
+# Patterns compiled once at import; the analyzers run them per file (and
+# per line for the Python fallback), so compiled objects skip the re-cache
+# lookup on every call
+_PY_IMPORT_RE = re.compile(r"^(?:import\s+(\w+)|from\s+([\w.]+)\s+import)")
+
+# ES6 / bare / CommonJS require / dynamic import, fused into one
+# alternation so JS content is scanned once instead of four times
+_JS_IMPORT_RE = re.compile(
+    r'import\s+.*?\s+from\s+[\'"]([^\'"]+)[\'"]'
+    r'|import\s*\(\s*[\'"]([^\'"]+)[\'"]\s*\)'
+    r'|import\s+[\'"]([^\'"]+)[\'"]'
+    r'|require\s*\(\s*[\'"]([^\'"]+)[\'"]\s*\)'
+)
+
+# Standard links / reference-style links / code blocks with file names,
+# fused the same way
+_MD_LINK_RE = re.compile(
+    r"\[.*?\]\(([^)]+)\)"
+    r"|^\[.*?\]:\s*(\S+)"
+    r"|```\w*\s*#?\s*(\S+\.\w+)",
+    re.MULTILINE,
+)
+
+# Bytes twins of the scan patterns (both are pure ASCII), so JS and
+# markdown content can be matched without decoding to str first
+_JS_IMPORT_RE_B = re.compile(_JS_IMPORT_RE.pattern.encode("ascii"))
+_MD_LINK_RE_B = re.compile(_MD_LINK_RE.pattern.encode("ascii"), re.MULTILINE)
+
+# DOT identifier mangling in one string pass instead of three replaces
+_DOT_TRANS = str.maketrans("/.-", "___")
+
+# Keys that commonly hold file paths in JSON/YAML configs
+_PATH_KEYS = frozenset(
+    {"path", "file", "entry_point", "main", "source", "config", "include"}
+)
+
+# Extensions whose extracted deps are cached across builds (content-hashed)
+_CACHED_EXTS = frozenset({".py", ".js", ".jsx", ".ts", ".tsx", ".mjs", ".md"})
+
+# Below this many uncached files, worker-process startup costs more than
+# the parallel parse saves
+_PARALLEL_MIN_FILES = 8
+
+# Files at least this large are mmapped for scanning; smaller ones are
+# read outright since mmap setup would dominate
+_MMAP_MIN_SIZE = 16 * 1024
+
+
+@contextmanager
+def _scan_buffer(f):
+    """Expose an open binary file as a regex-scannable bytes buffer.
+
+    Large files are mmapped so patterns run straight over the page cache
+    with no read copy and no str decode; small files are read normally.
     """
+    if os.fstat(f.fileno()).st_size >= _MMAP_MIN_SIZE:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield mm
+        finally:
+            mm.close()
+    else:
+        yield f.read()
 
-    def __init__(self, repo_path: Path):
-        self.repo_path = Path(repo_path)
-        self.file_index: dict[str, Path] = {}  # basename -> full path
-        self.module_index: dict[str, Path] = {}  # module name -> full path
 
-    def _build_file_index(self, files: list[Path]):
-        """Build index of all files for resolution"""
-        for file_path in files:
-            rel_path = file_path.relative_to(self.repo_path)
+class _ImportCollector(ast.NodeVisitor):
+    """
+    Collects import targets from a Python AST.
+
+    Imports can only appear as statements, so generic_visit descends into
+    statement children only - expression subtrees (the bulk of most
+    modules) are never visited. except handlers and match arms are not
+    stmt subclasses but hold statement bodies, so they are descended too.
+    Dispatch goes through a class-keyed table rather than NodeVisitor's
+    per-node getattr.
+    """
 
-            # Index by basename
-            self.file_index[file_path.name] = str(rel_path)
+    def __init__(self, file_path: Path):
+        self.file_path = file_path
+        # Cached once so relative imports resolve by index arithmetic
+        # instead of allocating a Path.parent chain per import
+        self._dir_parts = file_path.parent.parts
+        self.imports: set[str] = set()
+
+    def visit(self, node):
+        handler = _IMPORT_DISPATCH.get(type(node))
+        if handler is not None:
+            handler(self, node)
+        else:
+            self.generic_visit(node)
+
+    def visit_Import(self, node):
+        for alias in node.names:
+            self.imports.add(alias.name.split(".")[0])
+            self.imports.add(alias.name)
+
+    def visit_ImportFrom(self, node):
+        if node.module:
+            self.imports.add(node.module)
+            self.imports.add(node.module.split(".")[0])
+
+            # Handle relative imports - the anchoring package for level N
+            # is simply N steps up the cached directory parts
+            if node.level > 0:
+                anchor = len(self._dir_parts) - node.level
+                if anchor >= 0:
+                    self.imports.add(f"{self._dir_parts[anchor]}.{node.module}")
+
+    def generic_visit(self, node):
+        for _field, value in ast.iter_fields(node):
+            if isinstance(value, list):
+                for item in value:
+                    if isinstance(item, _STMT_CONTAINERS):
+                        self.visit(item)
+            elif isinstance(value, _STMT_CONTAINERS):
+                self.visit(value)
+
+    def _skip(self, node):
+        """No-op for statements that cannot nest other statements"""
+
+
+# Node types whose bodies can hold import statements: statements proper,
+# plus except handlers and match arms, which wrap statement lists without
+# being stmt subclasses themselves
+_STMT_CONTAINERS = (ast.stmt, ast.excepthandler, ast.match_case)
+
+_IMPORT_DISPATCH = {
+    ast.Import: _ImportCollector.visit_Import,
+    ast.ImportFrom: _ImportCollector.visit_ImportFrom,
+}
+
+# Leaf statements (assignments, bare expressions, returns, ...) cannot
+# contain imports; dispatching them to the no-op skips even the field
+# iteration of generic_visit. These dominate most module bodies.
+_IMPORT_DISPATCH.update(
+    dict.fromkeys(
+        (
+            ast.Expr,
+            ast.Assign,
+            ast.AugAssign,
+            ast.AnnAssign,
+            ast.Return,
+            ast.Delete,
+            ast.Pass,
+            ast.Break,
+            ast.Continue,
+            ast.Global,
+            ast.Nonlocal,
+            ast.Assert,
+            ast.Raise,
+        ),
+        _ImportCollector._skip,
+    )
+)
+
+
+# The per-file analyzers are module-level pure functions (bytes in, dep
+# strings out) so they pickle cleanly and can run in worker processes;
+# resolution against the file/module indices happens afterwards on the
+# main process. The dispatcher owns the single read per file.
+
+
+def _analyze_python_imports(file_path: Path, content: bytes) -> set[str]:
+    """Extract imports from Python source using AST"""
+    try:
+        # type_comments stay off - typed-comment parsing would only add
+        # grammar work with nothing for import collection
+        tree = ast.parse(content, type_comments=False)
+    except SyntaxError:
+        # Fall back to regex for files with syntax errors
+        return _regex_python_imports(content)
+
+    collector = _ImportCollector(file_path)
+    collector.visit(tree)
+    return collector.imports
+
+
+def _regex_python_imports(content: bytes) -> set[str]:
+    """Fallback regex-based Python import detection"""
+    imports = set()
+
+    for line in content.decode("utf-8", "ignore").splitlines():
+        match = _PY_IMPORT_RE.match(line.strip())
+        if match:
+            module = match.group(1) or match.group(2)
+            imports.add(module.split(".")[0])
+
+    return imports
+
+
+def _analyze_js_imports(buf) -> set[str]:
+    """Extract imports from JavaScript/TypeScript content (bytes or mmap)"""
+    imports = set()
+
+    for match in _JS_IMPORT_RE_B.finditer(buf):
+        target = next(g for g in match.groups() if g)
+        imports.add(target.decode("utf-8", "ignore"))
+
+    return imports
+
+
+def _analyze_json_references(content: bytes) -> set[str]:
+    """Extract file references from JSON config content"""
+    references: set[str] = set()
+
+    try:
+        # Bytes in, parsed out - orjson (when present) skips the
+        # Python-level UTF-8 decode entirely
+        data = _json_loads(content)
+    except Exception:
+        # Malformed config; nothing to reference
+        return references
 
-            # Index by stem (without extension)
-            self.file_index[file_path.stem] = str(rel_path)
+    # Find string values that look like file paths
+    _extract_path_references(data, references)
 
-            # Index by module path (for Python)
-            if file_path.suffix == ".py":
-                module_parts = list(rel_path.parts[:-1]) + [file_path.stem]
-                module_name = ".".join(module_parts)
-                self.module_index[module_name] = str(rel_path)
+    return references
 
-                # Also index partial module paths
-                for i in range(len(module_parts)):
-                    partial = ".".join(module_parts[i:])
-                    if partial not in self.module_index:
-                        self.module_index[partial] = str(rel_path)
 
-    def build_graph(
-        self, files: list[Path]
-    ) -> tuple[dict[str, set[str]], dict[str, set[str]]]:
-        """
-        Build dependency graph from list of files.
+def _analyze_yaml_references(content: bytes) -> set[str]:
+    """Extract file references from YAML content"""
+    references: set[str] = set()
 
-        Returns:
-            Tuple of (forward_graph, reverse_graph)
-            - forward_graph: file -> set of files it imports
-            - reverse_graph: file -> set of files that import it
-        """
-        self._build_file_index(files)
+    try:
+        data = yaml.load(content, Loader=_YamlLoader)
+    except Exception:
+        # Malformed config; nothing to reference
+        return references
 
-        forward_graph: dict[str, set[str]] = defaultdict(set)
-        reverse_graph: dict[str, set[str]] = defaultdict(set)
+    if data:
+        _extract_path_references(data, references)
 
-        for file_path in files:
-            rel_path = str(file_path.relative_to(self.repo_path))
-            ext = file_path.suffix.lower()
+    return references
 
-            try:
-                if ext == ".py":
-                    deps = self._analyze_python_imports(file_path)
-                elif ext in {".js", ".jsx", ".ts", ".tsx", ".mjs"}:
-                    deps = self._analyze_js_imports(file_path)
-                elif ext == ".json":
-                    deps = self._analyze_json_references(file_path)
-                elif ext in {".yaml", ".yml"}:
-                    deps = self._analyze_yaml_references(file_path)
-                elif ext == ".md":
-                    deps = self._analyze_markdown_links(file_path)
-                else:
-                    deps = set()
-
-                # Resolve dependencies to actual files
-                resolved_deps = self._resolve_dependencies(deps, file_path)
 
-                forward_graph[rel_path] = resolved_deps
+def _analyze_markdown_links(buf) -> set[str]:
+    """Extract file links from Markdown content (bytes or mmap)"""
+    references = set()
 
-                # Build reverse graph
-                for dep in resolved_deps:
-                    reverse_graph[dep].add(rel_path)
+    for match in _MD_LINK_RE_B.finditer(buf):
+        target = next(g for g in match.groups() if g)
+        # Filter to local file references
+        if not target.startswith((b"http://", b"https://", b"mailto:", b"#")):
+            references.add(target.decode("utf-8", "ignore"))
 
-            except Exception as e:
-                logger.warning(f"Error analyzing {rel_path}: {e}")
-                forward_graph[rel_path] = set()
+    return references
 
-        return dict(forward_graph), dict(reverse_graph)
 
-    def _analyze_python_imports(self, file_path: Path) -> set[str]:
-        """Extract imports from Python file using AST"""
-        imports = set()
+def _extract_path_references(data, references: set[str]):
+    """Extract path-like strings from nested data, iteratively.
 
-        try:
-            with open(file_path, encoding="utf-8", errors="ignore") as f:
-                content = f.read()
-
-            tree = ast.parse(content)
-
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        imports.add(alias.name.split(".")[0])
-                        imports.add(alias.name)
-
-                elif isinstance(node, ast.ImportFrom):
-                    if node.module:
-                        imports.add(node.module)
-                        imports.add(node.module.split(".")[0])
-
-                    # Handle relative imports
-                    if node.level > 0:
-                        # Relative import - need to resolve based on file location
-                        current_dir = file_path.parent
-                        for _ in range(node.level - 1):
-                            current_dir = current_dir.parent
-                        if node.module:
-                            imports.add(f"_relative:{current_dir.name}.{node.module}")
-
-        except SyntaxError:
-            # Fall back to regex for files with syntax errors
-            imports = self._regex_python_imports(file_path)
-
-        return imports
-
-    def _regex_python_imports(self, file_path: Path) -> set[str]:
-        """Fallback regex-based Python import detection"""
-        imports = set()
-
-        patterns = [
-            r"^import\s+(\w+)",
-            r"^from\s+([\w.]+)\s+import",
-        ]
+    An explicit stack replaces recursion: no per-node Python frame and
+    no recursion-limit concerns on large configs. The depth bound on
+    the stack entries keeps pathological nesting in check.
+    """
+    stack = deque([(data, 0)])
 
-        try:
-            with open(file_path, encoding="utf-8", errors="ignore") as f:
-                for line in f:
-                    for pattern in patterns:
-                        match = re.match(pattern, line.strip())
-                        if match:
-                            imports.add(match.group(1).split(".")[0])
-        except Exception:
-            pass
+    while stack:
+        obj, depth = stack.pop()
+        if depth > 10:  # Prevent runaway nesting
+            continue
 
-        return imports
+        if isinstance(obj, str):
+            # Check if string looks like a file path
+            if _looks_like_path(obj):
+                references.add(obj)
 
-    def _analyze_js_imports(self, file_path: Path) -> set[str]:
-        """Extract imports from JavaScript/TypeScript files"""
-        imports = set()
+        elif isinstance(obj, dict):
+            for key, value in obj.items():
+                # Check keys that commonly hold file paths
+                if key in _PATH_KEYS and isinstance(value, str):
+                    references.add(value)
+                stack.append((value, depth + 1))
 
-        patterns = [
-            # ES6 imports
-            r'import\s+.*?\s+from\s+[\'"]([^\'"]+)[\'"]',
-            r'import\s+[\'"]([^\'"]+)[\'"]',
-            # CommonJS require
-            r'require\s*\(\s*[\'"]([^\'"]+)[\'"]\s*\)',
-            # Dynamic imports
-            r'import\s*\(\s*[\'"]([^\'"]+)[\'"]\s*\)',
-        ]
+        elif isinstance(obj, list):
+            stack.extend((item, depth + 1) for item in obj)
 
-        try:
-            with open(file_path, encoding="utf-8", errors="ignore") as f:
-                content = f.read()
 
-            for pattern in patterns:
-                matches = re.findall(pattern, content)
-                for match in matches:
-                    imports.add(match)
+def _looks_like_path(s: str) -> bool:
+    """Check if a string looks like a file path.
 
-        except Exception:
-            pass
+    Called for every string in every config file, so this is plain
+    character ops rather than a regex - cheaper to dispatch at this
+    call rate.
+    """
+    n = len(s)
+    if not n or n > 200:
+        return False
+
+    # A separator anywhere (also covers ./ and ../ prefixes)
+    if "/" in s:
+        return True
+
+    # Ends in a short extension: a dot followed by 1-5 word characters
+    dot = s.rfind(".")
+    if dot == -1 or not 1 <= n - dot - 1 <= 5:
+        return False
+    return all(c.isalnum() or c == "_" for c in s[dot + 1 :])
+
+
+# Extension -> analyzer, one dict lookup per file instead of an if/elif
+# ladder over extension sets
+_ANALYZERS: dict[str, Callable[..., set[str]]] = {
+    ".py": _analyze_python_imports,
+    ".js": _analyze_js_imports,
+    ".jsx": _analyze_js_imports,
+    ".ts": _analyze_js_imports,
+    ".tsx": _analyze_js_imports,
+    ".mjs": _analyze_js_imports,
+    ".json": _analyze_json_references,
+    ".yaml": _analyze_yaml_references,
+    ".yml": _analyze_yaml_references,
+    ".md": _analyze_markdown_links,
+}
+
+# Analyzers that scan a flat buffer and so can run over an mmap directly
+_BUFFER_ANALYZERS = frozenset({_analyze_js_imports, _analyze_markdown_links})
+
+
+def _dispatch_analyze(file_path: Path, content: bytes | None = None) -> set[str]:
+    """Run the extension-appropriate analyzer; errors yield no deps.
+
+    Callers already holding the file's bytes (e.g. after hashing them
+    for the cache) pass them in so the file is opened and read at most
+    once; otherwise the dispatcher reads - or mmaps - it here.
+    """
+    handler = _ANALYZERS.get(file_path.suffix.lower())
+    if handler is None:
+        return set()
+
+    try:
+        if handler is _analyze_python_imports:
+            if content is None:
+                content = file_path.read_bytes()
+            return handler(file_path, content)
+        if content is not None:
+            return handler(content)
+        if handler in _BUFFER_ANALYZERS:
+            with open(file_path, "rb") as f, _scan_buffer(f) as buf:
+                return handler(buf)
+        return handler(file_path.read_bytes())
+    except Exception as e:
+        logger.warning(f"Error analyzing {file_path}: {e}")
+        return set()
 
-        return imports
 
-    def _analyze_json_references(self, file_path: Path) -> set[str]:
-        """Extract file references from JSON config files"""
-        references = set()
+class DependencyGraphBuilder:
+    """
+    Builds dependency graphs by analyzing code imports and references.
+    Supports Python, JavaScript/TypeScript, and config file references.
+    """
 
+    def __init__(self, repo_path: Path):
+        self.repo_path = Path(repo_path)
+        # Resolved once; relative-import resolution would otherwise
+        # re-resolve the repo root for every candidate
+        self._repo_resolved = self.repo_path.resolve()
+        self.file_index: dict[str, str] = {}  # basename -> relative path
+        self.module_index: dict[str, str] = {}  # module name -> relative path
+        # Every resolvable key (basenames, stems, module forms) in one
+        # dict so resolution is a single lookup
+        self.resolution_index: dict[str, str] = {}
+        self._all_rel_paths: frozenset[str] = frozenset()
+
+        # Persistent extraction cache keyed by (path, content sha256):
+        # unchanged files skip the parse entirely on repeat builds.
+        # Fail-soft - a read-only or broken repo dir just disables caching.
+        # check_same_thread is off because the analyzer runs build_graph
+        # on an executor thread while the connection opens here; access
+        # is serialized (one build at a time), just not thread-pinned.
+        self._deps_cache: sqlite3.Connection | None = None
         try:
-            import json
-
-            with open(file_path, encoding="utf-8") as f:
-                data = json.load(f)
-
-            # Recursively find string values that look like file paths
-            self._extract_path_references(data, references)
-
+            self._deps_cache = sqlite3.connect(
+                self.repo_path / ".aether_depgraph_cache.sqlite",
+                check_same_thread=False,
+            )
+            self._deps_cache.execute(
+                "CREATE TABLE IF NOT EXISTS deps_cache "
+                "(path TEXT, sha BLOB, deps BLOB, PRIMARY KEY (path, sha))"
+            )
+        except Exception:
+            self._deps_cache = None
+
+    def _cached_deps(self, rel_path: str, sha: bytes) -> set[str] | None:
+        """Look up previously extracted deps for this exact content"""
+        if self._deps_cache is None:
+            return None
+        row = self._deps_cache.execute(
+            "SELECT deps FROM deps_cache WHERE path = ? AND sha = ?",
+            (rel_path, sha),
+        ).fetchone()
+        return pickle.loads(row[0]) if row else None
+
+    def _store_deps(self, rel_path: str, sha: bytes, deps: set[str]):
+        """Store extracted deps, superseding entries for older content"""
+        if self._deps_cache is None:
+            return
+        try:
+            self._deps_cache.execute(
+                "DELETE FROM deps_cache WHERE path = ?", (rel_path,)
+            )
+            self._deps_cache.execute(
+                "INSERT INTO deps_cache (path, sha, deps) VALUES (?, ?, ?)",
+                (rel_path, sha, pickle.dumps(deps)),
+            )
+            self._deps_cache.commit()
         except Exception:
             pass
 
-        return references
+    def _build_file_index(self, files: list[Path]):
+        """Build index of all files for resolution"""
+        entries = [(f, f.relative_to(self.repo_path)) for f in files]
+
+        # Basename and stem entries in one bulk comprehension (later files
+        # overwrite earlier ones, matching the per-file assignment order)
+        self.file_index = {
+            key: _intern(str(rel))
+            for file_path, rel in entries
+            for key in (file_path.name, file_path.stem)
+        }
+
+        # Module paths (for Python); setdefault is one C-level call where
+        # the membership-check-then-assign pattern was two lookups
+        module_index = self.module_index
+        for file_path, rel in entries:
+            if file_path.suffix != ".py":
+                continue
+            rel_str = _intern(str(rel))
+            module_parts = list(rel.parts[:-1]) + [file_path.stem]
+            module_index[".".join(module_parts)] = rel_str
 
-    def _analyze_yaml_references(self, file_path: Path) -> set[str]:
-        """Extract file references from YAML files"""
-        references = set()
+            # Also index partial module paths
+            for i in range(1, len(module_parts)):
+                module_index.setdefault(".".join(module_parts[i:]), rel_str)
 
-        try:
-            import yaml
+        # Unified lookup table; module entries win over file entries,
+        # matching the old module-index-first probe order
+        self.resolution_index = {**self.file_index, **module_index}
 
-            with open(file_path, encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+        # Known relative paths, so existence checks during resolution are
+        # hash lookups instead of stat syscalls
+        self._all_rel_paths = frozenset(_intern(str(rel)) for _, rel in entries)
 
-            if data:
-                self._extract_path_references(data, references)
+    def build_graph(
+        self, files: list[Path]
+    ) -> tuple[dict[str, set[str]], dict[str, set[str]]]:
+        """
+        Build dependency graph from list of files.
 
-        except Exception:
-            pass
+        Returns:
+            Tuple of (forward_graph, reverse_graph)
+            - forward_graph: file -> set of files it imports
+            - reverse_graph: file -> set of files that import it
+        """
+        self._build_file_index(files)
 
-        return references
+        forward_graph: dict[str, set[str]] = {}
+        # Edges collect into a flat list during the build; the reverse
+        # graph materializes in one post-pass instead of hash-set updates
+        # interleaved with resolution
+        edges: list[tuple[str, str]] = []
 
-    def _analyze_markdown_links(self, file_path: Path) -> set[str]:
-        """Extract file links from Markdown files"""
-        references = set()
+        # Phase 1: screen the persistent cache and collect misses; the
+        # bytes read for hashing are kept so misses are not read twice
+        rel_paths: dict[Path, str] = {}
+        shas: dict[Path, bytes] = {}
+        contents: dict[Path, bytes] = {}
+        deps_by_file: dict[Path, set[str]] = {}
+        misses: list[Path] = []
 
-        patterns = [
-            # Standard markdown links
-            r"\[.*?\]\(([^)]+)\)",
-            # Reference-style links
-            r"^\[.*?\]:\s*(\S+)",
-            # Code blocks with file names
-            r"```\w*\s*#?\s*(\S+\.\w+)",
-        ]
+        for file_path in files:
+            rel_path = _intern(str(file_path.relative_to(self.repo_path)))
+            rel_paths[file_path] = rel_path
+
+            deps = None
+            if (
+                self._deps_cache is not None
+                and file_path.suffix.lower() in _CACHED_EXTS
+            ):
+                try:
+                    content = file_path.read_bytes()
+                    sha = hashlib.sha256(content).digest()
+                    shas[file_path] = sha
+                    deps = self._cached_deps(rel_path, sha)
+                    if deps is None:
+                        contents[file_path] = content
+                except Exception:
+                    pass
+
+            if deps is None:
+                misses.append(file_path)
+            else:
+                deps_by_file[file_path] = deps
+
+        # Phase 2: extraction is independent per file, so large batches
+        # fan out across worker processes; resolution needs the shared
+        # indices and stays on the main process
+        if len(misses) >= _PARALLEL_MIN_FILES:
+            # Workers read their own files - shipping buffers through the
+            # pickle pipe would cost more than the re-read
+            contents.clear()
+            with ProcessPoolExecutor() as executor:
+                results = executor.map(_dispatch_analyze, misses, chunksize=64)
+                deps_by_file.update(zip(misses, results, strict=True))
+        else:
+            for file_path in misses:
+                deps_by_file[file_path] = _dispatch_analyze(
+                    file_path, contents.pop(file_path, None)
+                )
 
-        try:
-            with open(file_path, encoding="utf-8", errors="ignore") as f:
-                content = f.read()
+        for file_path in misses:
+            miss_sha = shas.get(file_path)
+            if miss_sha is not None:
+                self._store_deps(
+                    rel_paths[file_path], miss_sha, deps_by_file[file_path]
+                )
 
-            for pattern in patterns:
-                matches = re.findall(pattern, content, re.MULTILINE)
-                for match in matches:
-                    # Filter to local file references
-                    if not match.startswith(("http://", "https://", "mailto:", "#")):
-                        references.add(match)
+        # Phase 3: resolve dependencies to actual files
+        for file_path in files:
+            rel_path = rel_paths[file_path]
 
-        except Exception:
-            pass
+            try:
+                resolved_deps = self._resolve_dependencies(
+                    deps_by_file[file_path], file_path, rel_path
+                )
 
-        return references
+                forward_graph[rel_path] = resolved_deps
 
-    def _extract_path_references(self, data, references: set[str], depth: int = 0):
-        """Recursively extract path-like strings from nested data"""
-        if depth > 10:  # Prevent infinite recursion
-            return
+                for dep in resolved_deps:
+                    edges.append((rel_path, dep))
 
-        if isinstance(data, str):
-            # Check if string looks like a file path
-            if self._looks_like_path(data):
-                references.add(data)
+            except Exception as e:
+                logger.warning(f"Error analyzing {rel_path}: {e}")
+                forward_graph[rel_path] = set()
 
-        elif isinstance(data, dict):
-            for key, value in data.items():
-                # Check keys that commonly hold file paths
-                if key in {
-                    "path",
-                    "file",
-                    "entry_point",
-                    "main",
-                    "source",
-                    "config",
-                    "include",
-                }:
-                    if isinstance(value, str):
-                        references.add(value)
-                self._extract_path_references(value, references, depth + 1)
-
-        elif isinstance(data, list):
-            for item in data:
-                self._extract_path_references(item, references, depth + 1)
-
-    def _looks_like_path(self, s: str) -> bool:
-        """Check if a string looks like a file path"""
-        if not s or len(s) > 200:
-            return False
-
-        # Check for file extensions
-        path_patterns = [
-            r"\.\w{1,5}$",  # Has extension
-            r"^\./",  # Relative path starting with ./
-            r"^\.\./",  # Parent directory reference
-            r"/",  # Contains directory separator
-        ]
-
-        return any(re.search(p, s) for p in path_patterns)
-
-    def _resolve_dependencies(self, deps: set[str], source_file: Path) -> set[str]:
+        # Build reverse graph from the edge list
+        reverse_graph: dict[str, set[str]] = {}
+        for source, target in edges:
+            reverse_graph.setdefault(target, set()).add(source)
+
+        return forward_graph, reverse_graph
+
+    def _resolve_dependencies(
+        self, deps: set[str], source_file: Path, source_rel: str
+    ) -> set[str]:
         """Resolve dependency references to actual file paths"""
         resolved = set()
-        source_rel = source_file.relative_to(self.repo_path)
 
         for dep in deps:
             resolved_path = self._resolve_single_dep(dep, source_file)
-            if resolved_path and resolved_path != str(source_rel):
+            if resolved_path and resolved_path != source_rel:
                 resolved.add(resolved_path)
 
         return resolved
@@ -308,44 +611,29 @@ class DependencyGraphBuilder:
     def _resolve_single_dep(self, dep: str, source_file: Path) -> str | None:
         """Resolve a single dependency to a file path"""
 
-        # Handle relative imports (Python)
+        # Handle relative imports recorded under the old marker form
+        # (still present in previously cached extractions)
         if dep.startswith("_relative:"):
-            module_path = dep.replace("_relative:", "")
-            if module_path in self.module_index:
-                return self.module_index[module_path]
+            return self.resolution_index.get(dep[len("_relative:") :])
 
-        # Handle relative paths (./foo, ../bar)
+        # Handle relative paths (./foo, ../bar); candidates are checked
+        # against the in-memory path set, not the filesystem
         if dep.startswith("."):
             try:
                 resolved = (source_file.parent / dep).resolve()
+                base_rel = str(resolved.relative_to(self._repo_resolved))
                 # Try with various extensions
                 for ext in ["", ".py", ".js", ".ts", ".json", ".yaml", ".yml", ".md"]:
-                    candidate = Path(str(resolved) + ext)
-                    if candidate.exists():
-                        try:
-                            return str(candidate.relative_to(self.repo_path))
-                        except ValueError:
-                            pass
-            except Exception:
+                    candidate = base_rel + ext
+                    if candidate in self._all_rel_paths:
+                        return _intern(candidate)
+            except (ValueError, OSError):
                 pass
 
-        # Check module index (Python modules)
-        if dep in self.module_index:
-            return self.module_index[dep]
-
-        # Check file index
-        if dep in self.file_index:
-            return self.file_index[dep]
-
-        # Try adding common extensions
-        for ext in [".py", ".js", ".ts", ".json", ".yaml", ".yml", ".md"]:
-            if dep + ext in self.file_index:
-                return self.file_index[dep + ext]
-
-        # Handle node_modules style imports (just record as external)
-        # We don't resolve these as they're external dependencies
-
-        return None
+        # One indexed lookup covers module names, partial modules,
+        # basenames and stems; stems already subsume the old
+        # dep-plus-extension probing (unresolved deps are external)
+        return self.resolution_index.get(dep)
 
     def get_orphaned_files(
         self,
@@ -356,19 +644,19 @@ class DependencyGraphBuilder:
         """
         Find orphaned files that are not reachable from any entry point.
         """
-        # BFS from entry points
-        visited = set()
-        queue = list(entry_points)
+        # BFS from entry points; deque gives O(1) dequeue vs list.pop(0),
+        # and marking nodes visited on enqueue keeps them out of the queue
+        # entirely
+        visited = set(entry_points)
+        queue = deque(entry_points)
 
         while queue:
-            current = queue.pop(0)
-            if current in visited:
-                continue
-            visited.add(current)
+            current = queue.popleft()
 
             # Add files this one imports
             for dep in forward_graph.get(current, set()):
                 if dep not in visited:
+                    visited.add(dep)
                     queue.append(dep)
 
         # Orphaned = all files - reachable files
@@ -380,70 +668,102 @@ class DependencyGraphBuilder:
     def find_circular_dependencies(
         self, forward_graph: dict[str, set[str]]
     ) -> list[list[str]]:
-        """Find circular dependencies in the graph"""
-        cycles = []
-        visited = set()
-        rec_stack = set()
-
-        def dfs(node: str, path: list[str]) -> bool:
-            visited.add(node)
-            rec_stack.add(node)
-            path.append(node)
-
-            for neighbor in forward_graph.get(node, set()):
-                if neighbor not in visited:
-                    if dfs(neighbor, path):
-                        return True
-                elif neighbor in rec_stack:
-                    # Found cycle
-                    cycle_start = path.index(neighbor)
-                    cycles.append(path[cycle_start:] + [neighbor])
-                    return False
-
-            path.pop()
-            rec_stack.remove(node)
-            return False
-
-        for node in forward_graph:
-            if node not in visited:
-                dfs(node, [])
+        """
+        Find circular dependencies in the graph.
+
+        Uses iterative Tarjan SCC: O(V+E) total, no Python recursion limit
+        concerns, and no quadratic path scans. Each returned list is one
+        strongly connected component participating in a cycle (including
+        single files that import themselves).
+        """
+        index_of: dict[str, int] = {}
+        lowlink: dict[str, int] = {}
+        on_stack: set[str] = set()
+        scc_stack: list[str] = []
+        cycles: list[list[str]] = []
+        counter = 0
+
+        for root in forward_graph:
+            if root in index_of:
+                continue
+
+            # Work stack of (node, neighbor iterator) frames
+            work = [(root, iter(forward_graph.get(root, ())))]
+            index_of[root] = lowlink[root] = counter
+            counter += 1
+            scc_stack.append(root)
+            on_stack.add(root)
+
+            while work:
+                node, neighbors = work[-1]
+                advanced = False
+                for neighbor in neighbors:
+                    if neighbor not in index_of:
+                        index_of[neighbor] = lowlink[neighbor] = counter
+                        counter += 1
+                        scc_stack.append(neighbor)
+                        on_stack.add(neighbor)
+                        work.append(
+                            (neighbor, iter(forward_graph.get(neighbor, ())))
+                        )
+                        advanced = True
+                        break
+                    if neighbor in on_stack:
+                        lowlink[node] = min(lowlink[node], index_of[neighbor])
+                if advanced:
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+                if lowlink[node] == index_of[node]:
+                    # node roots an SCC; pop its members
+                    scc = []
+                    while True:
+                        member = scc_stack.pop()
+                        on_stack.remove(member)
+                        scc.append(member)
+                        if member == node:
+                            break
+                    if len(scc) > 1 or node in forward_graph.get(node, ()):
+                        scc.reverse()
+                        cycles.append(scc)
 
         return cycles
 
     def generate_dot_graph(
-        self, forward_graph: dict[str, set[str]], orphaned: set[str] = None
+        self, forward_graph: dict[str, set[str]], orphaned: set[str] | None = None
     ) -> str:
-        """Generate DOT format graph for visualization"""
-        lines = ["digraph dependencies {", "  rankdir=LR;", "  node [shape=box];", ""]
-
-        # Add nodes with styling
-        for node in forward_graph:
-            style = ""
-            if orphaned and node in orphaned:
-                style = " [style=filled, fillcolor=red]"
-            elif node.endswith((".py", ".js", ".ts")):
-                style = " [style=filled, fillcolor=lightblue]"
-            elif node.endswith(".md"):
-                style = " [style=filled, fillcolor=lightyellow]"
-            elif node.endswith(".json"):
-                style = " [style=filled, fillcolor=lightgreen]"
-
-            safe_name = node.replace("/", "_").replace(".", "_").replace("-", "_")
-            lines.append(f'  {safe_name} [label="{node}"]{style};')
-
-        lines.append("")
-
-        # Add edges
-        for source, targets in forward_graph.items():
-            source_safe = source.replace("/", "_").replace(".", "_").replace("-", "_")
-            for target in targets:
-                target_safe = (
-                    target.replace("/", "_").replace(".", "_").replace("-", "_")
-                )
-                lines.append(f"  {source_safe} -> {target_safe};")
+        """Generate DOT format graph for visualization.
+
+        Lines stream from generators straight into one join; name
+        mangling is a single str.translate pass per identifier.
+        """
 
-        lines.append("}")
-        return "\n".join(lines)
+        def node_lines():
+            for node in forward_graph:
+                style = ""
+                if orphaned and node in orphaned:
+                    style = " [style=filled, fillcolor=red]"
+                elif node.endswith((".py", ".js", ".ts")):
+                    style = " [style=filled, fillcolor=lightblue]"
+                elif node.endswith(".md"):
+                    style = " [style=filled, fillcolor=lightyellow]"
+                elif node.endswith(".json"):
+                    style = " [style=filled, fillcolor=lightgreen]"
+
+                yield f'  {node.translate(_DOT_TRANS)} [label="{node}"]{style};'
+
+        def edge_lines():
+            for source, targets in forward_graph.items():
+                source_safe = source.translate(_DOT_TRANS)
+                for target in targets:
+                    yield f"  {source_safe} -> {target.translate(_DOT_TRANS)};"
+
+        header = ["digraph dependencies {", "  rankdir=LR;", "  node [shape=box];", ""]
+        return "\n".join(chain(header, node_lines(), [""], edge_lines(), ["}"]))
 
 
 if __name__ == "__main__":
@@ -6,16 +6,62 @@ Handles moving files to quarantine folder and tracking changes.
 Part of AetherCore Repository Cleanup System
 """
 
+import contextlib
+import io
 import json
 import logging
 import os
 import shutil
+import stat
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
+# orjson parses and serializes the manifest several times faster than
+# stdlib json once it accumulates a few thousand file records; entirely
+# optional, stdlib json remains the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _dumps(obj) -> bytes:
+    return orjson.dumps(obj) if orjson is not None else json.dumps(obj).encode()
+
+
+def _loads(data: bytes):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+# Session and file records reuse a small set of timestamp strings (every
+# file in a batch shares one), so parsed datetimes are memoized
+_parse_iso = lru_cache(maxsize=4096)(datetime.fromisoformat)
+
+# Per-file block of the restore script; filled via format_map so each
+# file costs one substitution pass instead of four f-string writes
+_RESTORE_ENTRY = """\
+# Restore: {original_path}
+mkdir -p "$REPO_ROOT/{original_parent}"
+mv "$REPO_ROOT/{quarantine_path}" "$REPO_ROOT/{original_path}"
+echo "Restored: {original_path}"
+
+"""
+
+
+# Compact the journal once it outgrows both this floor and twice the
+# snapshot size
+_COMPACT_MIN_BYTES = 64 * 1024
+
+# Batches above this size move files through a thread pool; smaller ones
+# are not worth the pool startup
+_PARALLEL_MOVE_MIN = 32
+
+
 class QuarantineManager:
     """
     Manages file quarantine operations:
@@ -27,38 +73,181 @@ class QuarantineManager:
 
     QUARANTINE_DIR = "quarantine"
     MANIFEST_FILE = "quarantine_manifest.json"
+    JOURNAL_FILE = "quarantine_manifest.jsonl"
     RESTORE_SCRIPT = "restore_files.sh"
 
     def __init__(self, repo_path: Path):
         self.repo_path = Path(repo_path).resolve()
         self.quarantine_path = self.repo_path / self.QUARANTINE_DIR
         self.manifest_path = self.quarantine_path / self.MANIFEST_FILE
+        self.journal_path = self.quarantine_path / self.JOURNAL_FILE
+
+        # Moves run per file, so their paths are joined as plain strings
+        # against these cached roots rather than through Path arithmetic
+        self._repo_str = str(self.repo_path)
+        self._q_str = str(self.quarantine_path)
         self.manifest: dict = self._load_manifest()
 
+        # Session lookups are dict hits instead of list scans; kept in
+        # sync whenever a session is appended
+        self._sessions_by_id: dict[str, dict] = {
+            s["session_id"]: s for s in self.manifest["quarantine_sessions"]
+        }
+
+        try:
+            self._journal_size = self.journal_path.stat().st_size
+        except OSError:
+            self._journal_size = 0
+
+        # Inside a `with` block events are buffered in memory and appended
+        # in one write on exit, instead of one append per mutation
+        self._deferred = False
+        self._pending_events: list[dict] = []
+
+        # Serializes manifest/journal mutation when moves run on threads
+        self._lock = threading.Lock()
+
+        # Destination dirs already created this batch; files cluster in
+        # the same parents, so most per-file makedirs calls are skipped
+        self._ensured_dirs: set[str] = set()
+
+        # Whether quarantine lives on the repo's device, checked once: it
+        # decides rename vs kernel-side copy per move. A quarantine dir
+        # that does not exist yet will be created under the repo root,
+        # hence on the same device.
+        try:
+            self._same_dev = (
+                self.quarantine_path.stat().st_dev == self.repo_path.stat().st_dev
+            )
+        except OSError:
+            self._same_dev = True
+
+    def __enter__(self):
+        self._deferred = True
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._deferred = False
+        self.flush()
+
+    def flush(self):
+        """Append any deferred events to the journal now"""
+        if self._pending_events:
+            events, self._pending_events = self._pending_events, []
+            self._write_events(events)
+
     def _load_manifest(self) -> dict:
-        """Load existing manifest or create new one"""
+        """Load the manifest snapshot and replay the journal on top"""
+        manifest = None
+
         if self.manifest_path.exists():
             try:
-                with open(self.manifest_path) as f:
-                    return json.load(f)
+                manifest = _loads(self.manifest_path.read_bytes())
             except Exception as e:
                 logger.warning(f"Could not load manifest: {e}")
 
-        return {
-            "created": datetime.now().isoformat(),
-            "last_updated": datetime.now().isoformat(),
-            "quarantine_sessions": [],
-            "files": {},
-        }
+        if manifest is None:
+            manifest = {
+                "created": datetime.now().isoformat(),
+                "last_updated": datetime.now().isoformat(),
+                "quarantine_sessions": [],
+                "files": {},
+            }
 
-    def _save_manifest(self):
-        """Save manifest to file"""
+        if self.journal_path.exists():
+            try:
+                with open(self.journal_path, "rb") as f:
+                    for line in f:
+                        if line.strip():
+                            self._apply_event(manifest, _loads(line))
+            except Exception as e:
+                logger.warning(f"Could not replay manifest journal: {e}")
+
+        return manifest
+
+    @staticmethod
+    def _apply_event(manifest: dict, event: dict):
+        """Apply one journal event to the in-memory manifest"""
+        op = event["op"]
+
+        if op == "move":
+            record = event["record"]
+            manifest["files"][record["original_path"]] = record
+        elif op == "session":
+            manifest["quarantine_sessions"].append(event["session"])
+        elif op == "restore":
+            record = manifest["files"].get(event["file"])
+            if record:
+                record["restored"] = True
+                record["restored_at"] = event["ts"]
+        elif op == "delete":
+            record = manifest["files"].get(event["file"])
+            if record:
+                record["deleted"] = True
+                record["deleted_at"] = event["ts"]
+        elif op == "clean_session":
+            for file_path in event["files"]:
+                if file_path in manifest["files"]:
+                    manifest["files"][file_path]["cleaned"] = True
+
+        if "ts" in event:
+            manifest["last_updated"] = event["ts"]
+
+    def _append_event(self, event: dict):
+        """Record one mutation; an append is O(event), not O(manifest).
+
+        The corresponding in-memory change is applied by the caller;
+        the journal exists so other processes (and the next load) see it
+        without a full manifest rewrite per mutation.
+        """
+        if self._deferred:
+            self._pending_events.append(event)
+            return
+        self._write_events([event])
+
+    def _write_events(self, events: list[dict]):
+        """Append events to the journal, compacting when it outgrows the snapshot"""
+        self.quarantine_path.mkdir(parents=True, exist_ok=True)
+
+        payload = b"".join(_dumps(e) + b"\n" for e in events)
+        with open(self.journal_path, "ab") as f:
+            f.write(payload)
+        self._journal_size += len(payload)
+
+        try:
+            snapshot_size = self.manifest_path.stat().st_size
+        except OSError:
+            snapshot_size = 0
+
+        if self._journal_size > max(_COMPACT_MIN_BYTES, 2 * snapshot_size):
+            self.compact()
+
+    def compact(self):
+        """Fold the journal into a fresh manifest snapshot"""
         self.manifest["last_updated"] = datetime.now().isoformat()
 
         self.quarantine_path.mkdir(parents=True, exist_ok=True)
 
-        with open(self.manifest_path, "w") as f:
-            json.dump(self.manifest, f, indent=2)
+        if orjson is not None:
+            payload = orjson.dumps(self.manifest, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(self.manifest, indent=2).encode()
+
+        # Write-then-rename so a crash mid-write never leaves a truncated
+        # snapshot: the tmp file lives in the same directory (rename must
+        # not cross filesystems) and is fsynced before it replaces the
+        # manifest atomically
+        tmp_path = self.manifest_path.with_suffix(".json.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.manifest_path)
+
+        # Journal entries are folded into the snapshot; start fresh
+        with contextlib.suppress(FileNotFoundError):
+            self.journal_path.unlink()
+        self._journal_size = 0
 
     def move_to_quarantine(
         self,
@@ -79,80 +268,167 @@ class QuarantineManager:
         Returns:
             List of dicts with move results
         """
+        # One timestamp for the whole batch - every file shares the same
+        # logical move time, so there is no point re-reading the clock
+        # (and re-formatting) per file
+        now = datetime.now()
+        timestamp = now.isoformat()
+
         if not session_id:
-            session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+            session_id = now.strftime("%Y%m%d_%H%M%S")
 
-        results = []
-        session_files = []
+        # Destination dirs are namespaced by session, so the ensured set
+        # starts fresh for each batch
+        self._ensured_dirs = set()
 
+        # Quarantine batches cluster in the same directories, so source
+        # metadata is gathered with one scandir per parent instead of a
+        # stat syscall per file; the lstat results ride along into the
+        # manifest records
+        by_parent: dict[str, list[str]] = {}
         for file_path in files:
-            result = self._move_single_file(
+            by_parent.setdefault(str(Path(file_path).parent), []).append(file_path)
+
+        stat_by_path: dict[str, os.stat_result] = {}
+        for parent, children in by_parent.items():
+            try:
+                with os.scandir(self.repo_path / parent) as entries:
+                    by_name = {entry.name: entry for entry in entries}
+            except OSError:
+                continue
+            for file_path in children:
+                entry = by_name.get(Path(file_path).name)
+                if entry is not None:
+                    with contextlib.suppress(OSError):
+                        stat_by_path[file_path] = entry.stat(follow_symlinks=False)
+
+        def move_one(file_path: str) -> dict:
+            return self._move_single_file(
                 file_path,
                 reasons.get(file_path, []) if reasons else [],
                 session_id,
+                timestamp,
                 dry_run,
+                source_stat=stat_by_path.get(file_path),
             )
-            results.append(result)
 
-            if result["success"]:
-                session_files.append(result)
+        # Moves are syscall-bound (rename/mkdir/rmdir release the GIL),
+        # so large batches overlap them on a thread pool; map preserves
+        # input order for the returned results
+        if not dry_run and len(files) > _PARALLEL_MOVE_MIN:
+            workers = min(32, (os.cpu_count() or 4) * 4)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(move_one, files))
+        else:
+            results = [move_one(file_path) for file_path in files]
+
+        session_files = [r for r in results if r["success"]]
 
         # Record session
         if session_files and not dry_run:
-            self.manifest["quarantine_sessions"].append(
+            session_record = {
+                "session_id": session_id,
+                "timestamp": timestamp,
+                "files_count": len(session_files),
+                "files": [f["original_path"] for f in session_files],
+            }
+            self.manifest["quarantine_sessions"].append(session_record)
+            self._sessions_by_id[session_id] = session_record
+            self._append_event(
                 {
-                    "session_id": session_id,
-                    "timestamp": datetime.now().isoformat(),
-                    "files_count": len(session_files),
-                    "files": [f["original_path"] for f in session_files],
+                    "op": "session",
+                    "ts": session_record["timestamp"],
+                    "session": session_record,
                 }
             )
-            self._save_manifest()
             self._generate_restore_script(session_id, session_files)
 
         return results
 
     def _move_single_file(
-        self, file_path: str, reasons: list[str], session_id: str, dry_run: bool
+        self,
+        file_path: str,
+        reasons: list[str],
+        session_id: str,
+        timestamp: str,
+        dry_run: bool,
+        source_stat: os.stat_result = None,
     ) -> dict:
-        """Move a single file to quarantine"""
-        source = self.repo_path / file_path
+        """Move a single file to quarantine.
 
-        if not source.exists():
-            return {
-                "original_path": file_path,
-                "success": False,
-                "error": "File not found",
-            }
+        source_stat carries the batched scandir lstat result from
+        move_to_quarantine; when absent the file is lstat'd directly,
+        which settles existence and symlink-ness in one syscall.
+        Paths are plain strings throughout - this runs once per file,
+        and Path arithmetic plus relative_to would dominate it.
+        """
+        source = os.path.join(self._repo_str, file_path)
+
+        if source_stat is None:
+            try:
+                source_stat = os.lstat(source)
+            except OSError:
+                return {
+                    "original_path": file_path,
+                    "success": False,
+                    "error": "File not found",
+                }
 
-        # Create quarantine path preserving directory structure
-        quarantine_subdir = self.quarantine_path / session_id
-        dest = quarantine_subdir / file_path
+        # Quarantine destination preserving directory structure
+        dest = os.path.join(self._q_str, session_id, file_path)
+        quarantine_rel = f"{self.QUARANTINE_DIR}/{session_id}/{file_path}"
+        is_symlink = stat.S_ISLNK(source_stat.st_mode)
 
         try:
             if not dry_run:
-                dest.parent.mkdir(parents=True, exist_ok=True)
-                shutil.move(str(source), str(dest))
+                dest_parent = os.path.dirname(dest)
+                if dest_parent not in self._ensured_dirs:
+                    os.makedirs(dest_parent, exist_ok=True)
+                    self._ensured_dirs.add(dest_parent)
+                if self._same_dev and not is_symlink:
+                    # Common case: one rename syscall, none of shutil's
+                    # stat/isdir/symlink probing. EXDEV (e.g. a bind
+                    # mount inside the repo) falls back to shutil.
+                    try:
+                        os.replace(source, dest)
+                    except OSError:
+                        shutil.move(source, dest)
+                elif self._same_dev:
+                    shutil.move(source, dest)
+                else:
+                    self._sendfile_move(source, dest)
 
                 # Clean up empty parent directories
-                self._cleanup_empty_dirs(source.parent)
+                self._cleanup_empty_dirs(Path(os.path.dirname(source)))
 
             # Update manifest
             file_record = {
                 "original_path": file_path,
-                "quarantine_path": str(dest.relative_to(self.repo_path)),
+                "quarantine_path": quarantine_rel,
                 "session_id": session_id,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": timestamp,
                 "reasons": reasons,
                 "restored": False,
+                "size": source_stat.st_size,
+                "mtime_ns": source_stat.st_mtime_ns,
+                "is_symlink": is_symlink,
             }
 
             if not dry_run:
-                self.manifest["files"][file_path] = file_record
+                with self._lock:
+                    self.manifest["files"][file_path] = file_record
+                    self._append_event(
+                        {
+                            "op": "move",
+                            "ts": file_record["timestamp"],
+                            "record": file_record,
+                        }
+                    )
 
             return {
                 "original_path": file_path,
-                "quarantine_path": str(dest.relative_to(self.repo_path)),
+                "original_parent": os.path.dirname(file_path) or ".",
+                "quarantine_path": quarantine_rel,
                 "success": True,
                 "dry_run": dry_run,
             }
@@ -161,20 +437,49 @@ class QuarantineManager:
             logger.error(f"Error moving {file_path}: {e}")
             return {"original_path": file_path, "success": False, "error": str(e)}
 
+    @staticmethod
+    def _sendfile_move(source, dest):
+        """Move across devices via kernel-side copy.
+
+        shutil.move would fall back to a userspace read/write loop here;
+        os.sendfile keeps the bytes in the kernel.
+        """
+        with open(source, "rb") as src, open(dest, "wb") as dst:
+            offset = 0
+            remaining = os.fstat(src.fileno()).st_size
+            while remaining > 0:
+                sent = os.sendfile(dst.fileno(), src.fileno(), offset, remaining)
+                if sent == 0:
+                    break
+                offset += sent
+                remaining -= sent
+
+        shutil.copystat(source, dest)
+        os.unlink(source)
+
     def _cleanup_empty_dirs(self, dir_path: Path):
         """Remove empty directories up to repo root"""
         try:
             while dir_path != self.repo_path:
-                if dir_path.is_dir() and not any(dir_path.iterdir()):
-                    dir_path.rmdir()
-                    logger.debug(f"Removed empty directory: {dir_path}")
-                    dir_path = dir_path.parent
-                else:
+                # scandir stops at the first entry - no Path objects are
+                # built just to prove the directory is non-empty, and a
+                # non-directory raises instead of needing its own stat
+                try:
+                    with os.scandir(dir_path) as entries:
+                        if next(entries, None) is not None:
+                            break
+                except (NotADirectoryError, FileNotFoundError):
                     break
+
+                os.rmdir(dir_path)
+                logger.debug(f"Removed empty directory: {dir_path}")
+                dir_path = dir_path.parent
         except Exception as e:
             logger.warning(f"Error cleaning directories: {e}")
 
-    def restore_file(self, file_path: str, dry_run: bool = False) -> dict:
+    def restore_file(
+        self, file_path: str, dry_run: bool = False, restored_at: str = None
+    ) -> dict:
         """Restore a single file from quarantine"""
         if file_path not in self.manifest["files"]:
             return {
@@ -195,20 +500,34 @@ class QuarantineManager:
         quarantine_path = self.repo_path / record["quarantine_path"]
         original_path = self.repo_path / file_path
 
-        if not quarantine_path.exists():
-            return {
-                "file_path": file_path,
-                "success": False,
-                "error": "Quarantined file not found",
-            }
-
         try:
-            if not dry_run:
+            if dry_run:
+                if not os.path.lexists(quarantine_path):
+                    return {
+                        "file_path": file_path,
+                        "success": False,
+                        "error": "Quarantined file not found",
+                    }
+            else:
                 original_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.move(str(quarantine_path), str(original_path))
+                # Rename directly instead of stat-then-move; a missing
+                # source surfaces from the syscall itself, and EXDEV
+                # (quarantine on another device) falls back to shutil
+                try:
+                    os.replace(quarantine_path, original_path)
+                except FileNotFoundError:
+                    return {
+                        "file_path": file_path,
+                        "success": False,
+                        "error": "Quarantined file not found",
+                    }
+                except OSError:
+                    shutil.move(str(quarantine_path), str(original_path))
                 record["restored"] = True
-                record["restored_at"] = datetime.now().isoformat()
-                self._save_manifest()
+                record["restored_at"] = restored_at or datetime.now().isoformat()
+                self._append_event(
+                    {"op": "restore", "ts": record["restored_at"], "file": file_path}
+                )
 
             return {"file_path": file_path, "success": True, "dry_run": dry_run}
 
@@ -218,18 +537,17 @@ class QuarantineManager:
 
     def restore_session(self, session_id: str, dry_run: bool = False) -> list[dict]:
         """Restore all files from a quarantine session"""
-        session = None
-        for s in self.manifest["quarantine_sessions"]:
-            if s["session_id"] == session_id:
-                session = s
-                break
+        session = self._sessions_by_id.get(session_id)
 
         if not session:
             return [{"success": False, "error": f"Session {session_id} not found"}]
 
+        # Shared restore timestamp for the whole session batch
+        restored_at = datetime.now().isoformat()
+
         results = []
         for file_path in session["files"]:
-            result = self.restore_file(file_path, dry_run)
+            result = self.restore_file(file_path, dry_run, restored_at)
             results.append(result)
 
         return results
@@ -238,45 +556,40 @@ class QuarantineManager:
         """Generate shell script to restore quarantined files"""
         script_path = self.quarantine_path / session_id / self.RESTORE_SCRIPT
 
-        lines = [
-            "#!/bin/bash",
-            "# Restore script for quarantine session: " + session_id,
-            "# Generated: " + datetime.now().isoformat(),
-            "",
-            "set -e",
-            "",
-            'SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"',
-            'REPO_ROOT="$(cd "$SCRIPT_DIR/../.." && pwd)"',
-            "",
-            'echo "Restoring files from quarantine session: ' + session_id + '"',
-            "",
-        ]
+        # One growable buffer instead of per-file list extends and a
+        # final join; the parent dir was recorded at move time so paths
+        # are not re-parsed here
+        buf = io.StringIO()
+        write = buf.write
+
+        write(
+            "#!/bin/bash\n"
+            f"# Restore script for quarantine session: {session_id}\n"
+            f"# Generated: {datetime.now().isoformat()}\n"
+            "\n"
+            "set -e\n"
+            "\n"
+            'SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"\n'
+            'REPO_ROOT="$(cd "$SCRIPT_DIR/../.." && pwd)"\n'
+            "\n"
+            f'echo "Restoring files from quarantine session: {session_id}"\n'
+            "\n"
+        )
 
+        entry = _RESTORE_ENTRY.format_map
         for f in files:
-            original = f["original_path"]
-            quarantined = f["quarantine_path"]
-
-            lines.extend(
-                [
-                    f"# Restore: {original}",
-                    f'mkdir -p "$REPO_ROOT/{Path(original).parent}"',
-                    f'mv "$REPO_ROOT/{quarantined}" "$REPO_ROOT/{original}"',
-                    f'echo "Restored: {original}"',
-                    "",
-                ]
-            )
-
-        lines.extend(
-            [
-                'echo ""',
-                'echo "All files restored successfully!"',
-                f'echo "Remember to remove the quarantine/{session_id} directory after verification"',
-            ]
+            if not f.get("original_parent"):
+                f = {**f, "original_parent": str(Path(f["original_path"]).parent)}
+            write(entry(f))
+
+        write(
+            'echo ""\n'
+            'echo "All files restored successfully!"\n'
+            f'echo "Remember to remove the quarantine/{session_id} directory after verification"'
         )
 
         script_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(script_path, "w") as f:
-            f.write("\n".join(lines))
+        script_path.write_text(buf.getvalue())
 
         # Make executable
         os.chmod(script_path, 0o755)
@@ -284,10 +597,13 @@ class QuarantineManager:
 
     def get_quarantine_summary(self) -> dict:
         """Get summary of quarantine status"""
-        total_files = len(self.manifest["files"])
-        restored_files = sum(
-            1 for f in self.manifest["files"].values() if f.get("restored")
-        )
+        files = self.manifest["files"]
+
+        restored_files = 0
+        for record in files.values():
+            if record.get("restored"):
+                restored_files += 1
+        total_files = len(files)
 
         return {
             "total_quarantined": total_files,
@@ -297,26 +613,28 @@ class QuarantineManager:
             "last_updated": self.manifest.get("last_updated"),
         }
 
-    def list_quarantined_files(self, session_id: str = None) -> list[dict]:
-        """List all quarantined files, optionally filtered by session"""
-        files = []
-
+    def iter_quarantined_files(self, session_id: str = None):
+        """Yield quarantined files lazily, optionally filtered by session"""
         for path, record in self.manifest["files"].items():
             if session_id and record.get("session_id") != session_id:
                 continue
 
-            files.append(
-                {
-                    "path": path,
-                    "quarantine_path": record["quarantine_path"],
-                    "session_id": record["session_id"],
-                    "timestamp": record["timestamp"],
-                    "reasons": record.get("reasons", []),
-                    "restored": record.get("restored", False),
-                }
-            )
+            yield {
+                "path": path,
+                "quarantine_path": record["quarantine_path"],
+                "session_id": record["session_id"],
+                "timestamp": record["timestamp"],
+                "reasons": record.get("reasons", []),
+                "restored": record.get("restored", False),
+            }
 
-        return sorted(files, key=lambda x: x["timestamp"], reverse=True)
+    def list_quarantined_files(self, session_id: str = None) -> list[dict]:
+        """List all quarantined files, newest first"""
+        return sorted(
+            self.iter_quarantined_files(session_id),
+            key=lambda x: x["timestamp"],
+            reverse=True,
+        )
 
     def permanently_delete(self, file_path: str) -> dict:
         """Permanently delete a quarantined file"""
@@ -337,7 +655,9 @@ class QuarantineManager:
             # Mark as deleted in manifest
             record["deleted"] = True
             record["deleted_at"] = datetime.now().isoformat()
-            self._save_manifest()
+            self._append_event(
+                {"op": "delete", "ts": record["deleted_at"], "file": file_path}
+            )
 
             return {"file_path": file_path, "success": True}
 
@@ -349,32 +669,69 @@ class QuarantineManager:
         from datetime import timedelta
 
         cutoff = datetime.now() - timedelta(days=days)
-        deleted_count = 0
 
+        # Collect expired sessions first, then delete their directories
+        # with unlinks overlapped on a thread pool - the closest stdlib
+        # gets to submitting a batch of removals to the kernel at once
+        expired = []
         for session in self.manifest["quarantine_sessions"]:
-            session_time = datetime.fromisoformat(session["timestamp"])
+            session_time = _parse_iso(session["timestamp"])
 
             if session_time < cutoff:
-                # Delete session directory
                 session_dir = self.quarantine_path / session["session_id"]
                 if session_dir.exists():
-                    shutil.rmtree(session_dir)
-                    deleted_count += 1
-
-                    # Mark files as cleaned
-                    for file_path in session["files"]:
-                        if file_path in self.manifest["files"]:
-                            self.manifest["files"][file_path]["cleaned"] = True
+                    expired.append((session, session_dir))
 
-        self._save_manifest()
+        def remove_tree(session_dir: Path):
+            # Best effort: one undeletable session must not abort the rest
+            try:
+                shutil.rmtree(session_dir)
+            except OSError as e:
+                logger.warning(f"Could not remove {session_dir}: {e}")
+
+        if len(expired) > 1:
+            workers = min(16, (os.cpu_count() or 4) * 2, len(expired))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                list(pool.map(remove_tree, (e[1] for e in expired)))
+        elif expired:
+            remove_tree(expired[0][1])
+
+        deleted_count = len(expired)
+        manifest_files = self.manifest["files"]
+
+        for session, _session_dir in expired:
+            # Mark files as cleaned
+            for file_path in session["files"]:
+                record = manifest_files.get(file_path)
+                if record is not None:
+                    record["cleaned"] = True
+
+            self._append_event(
+                {
+                    "op": "clean_session",
+                    "ts": datetime.now().isoformat(),
+                    "session_id": session["session_id"],
+                    "files": session["files"],
+                }
+            )
 
         return {"sessions_cleaned": deleted_count, "cutoff_date": cutoff.isoformat()}
 
 
 def generate_quarantine_report(manager: QuarantineManager) -> str:
     """Generate markdown report of quarantine status"""
-    summary = manager.get_quarantine_summary()
-    files = manager.list_quarantined_files()
+    # One pass over the manifest produces the summary counts and the
+    # per-session groupings together; going through the summary plus a
+    # sorted flat listing walked the same records twice only to regroup
+    # them here. File records insert in move order, so the groups come
+    # out time-ordered for free.
+    total = restored = 0
+    sessions: dict[str, list[dict]] = {}
+    for f in manager.iter_quarantined_files():
+        total += 1
+        if f["restored"]:
+            restored += 1
+        sessions.setdefault(f["session_id"], []).append(f)
 
     lines = [
         "# Quarantine Status Report",
@@ -385,14 +742,14 @@ def generate_quarantine_report(manager: QuarantineManager) -> str:
         "",
         "| Metric | Value |",
         "|--------|-------|",
-        f'| Total Quarantined | {summary["total_quarantined"]} |',
-        f'| Restored | {summary["restored"]} |',
-        f'| Pending Review | {summary["pending"]} |',
-        f'| Sessions | {summary["sessions"]} |',
+        f"| Total Quarantined | {total} |",
+        f"| Restored | {restored} |",
+        f"| Pending Review | {total - restored} |",
+        f'| Sessions | {len(manager.manifest["quarantine_sessions"])} |',
         "",
     ]
 
-    if files:
+    if sessions:
         lines.extend(
             [
                 "## Quarantined Files",
@@ -400,14 +757,6 @@ def generate_quarantine_report(manager: QuarantineManager) -> str:
             ]
         )
 
-        # Group by session
-        sessions = {}
-        for f in files:
-            sid = f["session_id"]
-            if sid not in sessions:
-                sessions[sid] = []
-            sessions[sid].append(f)
-
         for session_id, session_files in sessions.items():
             lines.append(f"### Session: {session_id}")
             lines.append("")
@@ -440,37 +789,36 @@ if __name__ == "__main__":
 
     args = parser.parse_args()
 
-    manager = QuarantineManager(Path(args.repo))
-
-    if args.list:
-        files = manager.list_quarantined_files()
-        for f in files:
-            status = "restored" if f["restored"] else "pending"
-            print(f"[{status}] {f['path']} (session: {f['session_id']})")
-
-    elif args.restore:
-        result = manager.restore_file(args.restore)
-        print(
-            f"Restore {'succeeded' if result['success'] else 'failed'}: {args.restore}"
-        )
-        if not result["success"]:
-            print(f"  Error: {result.get('error')}")
-
-    elif args.restore_session:
-        results = manager.restore_session(args.restore_session)
-        success = sum(1 for r in results if r["success"])
-        print(
-            f"Restored {success}/{len(results)} files from session {args.restore_session}"
-        )
+    # Defer manifest writes to a single save when the work is done
+    with QuarantineManager(Path(args.repo)) as manager:
+        if args.list:
+            for f in manager.iter_quarantined_files():
+                status = "restored" if f["restored"] else "pending"
+                print(f"[{status}] {f['path']} (session: {f['session_id']})")
+
+        elif args.restore:
+            result = manager.restore_file(args.restore)
+            print(
+                f"Restore {'succeeded' if result['success'] else 'failed'}: {args.restore}"
+            )
+            if not result["success"]:
+                print(f"  Error: {result.get('error')}")
+
+        elif args.restore_session:
+            results = manager.restore_session(args.restore_session)
+            success = sum(1 for r in results if r["success"])
+            print(
+                f"Restored {success}/{len(results)} files from session {args.restore_session}"
+            )
 
-    elif args.summary:
-        summary = manager.get_quarantine_summary()
-        print("Quarantine Summary:")
-        print(f"  Total: {summary['total_quarantined']}")
-        print(f"  Restored: {summary['restored']}")
-        print(f"  Pending: {summary['pending']}")
-        print(f"  Sessions: {summary['sessions']}")
-
-    elif args.report:
-        report = generate_quarantine_report(manager)
-        print(report)
+        elif args.summary:
+            summary = manager.get_quarantine_summary()
+            print("Quarantine Summary:")
+            print(f"  Total: {summary['total_quarantined']}")
+            print(f"  Restored: {summary['restored']}")
+            print(f"  Pending: {summary['pending']}")
+            print(f"  Sessions: {summary['sessions']}")
+
+        elif args.report:
+            report = generate_quarantine_report(manager)
+            print(report)
@@ -7,6 +7,8 @@ topic modeling, and text similarity.
 Part of AetherCore Repository Cleanup System
 """
 
+import hashlib
+import heapq
 import logging
 import math
 import re
@@ -14,8 +16,58 @@ from collections import Counter
 from dataclasses import dataclass, field
 from pathlib import Path
 
+try:
+    import hyperscan  # optional - SIMD multi-pattern matcher
+except ImportError:
+    hyperscan = None
+
 logger = logging.getLogger(__name__)
 
+# MinHash-LSH parameters for duplicate candidate generation: 64
+# permutations in 16 bands of 4 rows catches pairs above ~0.85 Jaccard
+# with high probability while near-never bucketing dissimilar files
+_MINHASH_PERMS = 64
+_LSH_BANDS = 16
+_LSH_ROWS = _MINHASH_PERMS // _LSH_BANDS
+_HASH_MASK = 0xFFFFFFFFFFFFFFFF
+_MINHASH_SALTS = [
+    (i * 0x9E3779B97F4A7C15 + 0x85EBCA6B) & _HASH_MASK for i in range(_MINHASH_PERMS)
+]
+
+
+def _stable_hash64(token: str) -> int:
+    """Seed-independent 64-bit token hash.
+
+    The builtin hash() is salted per interpreter run, which would make
+    the MinHash buckets - and thus borderline duplicate findings -
+    differ between CI runs on an identical tree.
+    """
+    return int.from_bytes(
+        hashlib.blake2b(token.encode(), digest_size=8).digest(), "little"
+    )
+
+
+# Extraction patterns, compiled once at import instead of hitting the
+# re cache on every file
+_PY_FUNC_RE = re.compile(r"def\s+(\w+)\s*\(")
+_PY_CLASS_RE = re.compile(r"class\s+(\w+)\s*[\(:]")
+_DOCSTRING_RE = re.compile(r'"""(.*?)"""|\'\'\'(.*?)\'\'\'', re.DOTALL)
+_PY_COMMENT_RE = re.compile(r"#\s*(.+)$", re.MULTILINE)
+_JS_FUNC_RES = [
+    re.compile(r"function\s+(\w+)\s*\("),
+    re.compile(r"const\s+(\w+)\s*=\s*(?:async\s*)?\("),
+    re.compile(r"(?:export\s+)?(?:async\s+)?function\s+(\w+)"),
+    re.compile(r"(\w+)\s*:\s*(?:async\s*)?\([^)]*\)\s*=>"),
+]
+_JS_CLASS_RE = re.compile(r"class\s+(\w+)")
+_JSDOC_RE = re.compile(r"/\*\*(.*?)\*/", re.DOTALL)
+_JS_COMMENT_RE = re.compile(r"//\s*(.+)$", re.MULTILINE)
+_MD_HEADING_RE = re.compile(r"^#+\s+(.+)$", re.MULTILINE)
+_MD_CODE_BLOCK_RE = re.compile(r"```.*?```", re.DOTALL)
+_MD_INLINE_CODE_RE = re.compile(r"`[^`]+`")
+_CAMEL_RE = re.compile(r"([a-z])([A-Z])")
+_WORD_RE = re.compile(r"\b[a-z]{3,}\b")
+
 
 @dataclass
 class FileSemantics:
@@ -28,6 +80,7 @@ class FileSemantics:
     entities: list[str] = field(default_factory=list)  # Functions, classes, etc.
     word_freq: dict[str, int] = field(default_factory=dict)
     tf_idf: dict[str, float] = field(default_factory=dict)
+    norm: float = 0.0  # Euclidean magnitude of the TF-IDF vector
 
 
 class SemanticAnalyzer:
@@ -211,6 +264,10 @@ class SemanticAnalyzer:
         self.file_semantics: dict[str, FileSemantics] = {}
         self.document_freq: Counter = Counter()  # For IDF calculation
         self.total_docs = 0
+        self.idf: dict[str, float] = {}
+        # Pairwise cosine similarities, keyed by sorted path pair; only
+        # non-zero entries are stored
+        self._sims: dict[tuple[str, str], float] = {}
 
     def analyze_all(self, files: list[Path]) -> dict:
         """
@@ -235,8 +292,10 @@ class SemanticAnalyzer:
 
         self.total_docs = len(self.file_semantics)
 
-        # Phase 2: Calculate TF-IDF scores
+        # Phase 2: Calculate TF-IDF scores, then sweep every file pair
+        # once; all later phases look similarities up in the cache
         self._calculate_tfidf()
+        self._sims = self._compute_pairwise_similarities()
 
         # Phase 3: Find semantic clusters
         clusters = self._find_clusters()
@@ -326,20 +385,15 @@ class SemanticAnalyzer:
     def _analyze_python(self, content: str, semantics: FileSemantics):
         """Analyze Python file"""
         # Extract function and class names
-        func_pattern = r"def\s+(\w+)\s*\("
-        class_pattern = r"class\s+(\w+)\s*[\(:]"
-
-        semantics.entities.extend(re.findall(func_pattern, content))
-        semantics.entities.extend(re.findall(class_pattern, content))
+        semantics.entities.extend(_PY_FUNC_RE.findall(content))
+        semantics.entities.extend(_PY_CLASS_RE.findall(content))
 
         # Extract docstrings
-        docstring_pattern = r'"""(.*?)"""|\'\'\'(.*?)\'\'\''
-        docstrings = re.findall(docstring_pattern, content, re.DOTALL)
+        docstrings = _DOCSTRING_RE.findall(content)
         doc_text = " ".join([d[0] or d[1] for d in docstrings])
 
         # Extract comments
-        comment_pattern = r"#\s*(.+)$"
-        comments = re.findall(comment_pattern, content, re.MULTILINE)
+        comments = _PY_COMMENT_RE.findall(content)
         comment_text = " ".join(comments)
 
         # Combine text for analysis
@@ -349,27 +403,17 @@ class SemanticAnalyzer:
     def _analyze_javascript(self, content: str, semantics: FileSemantics):
         """Analyze JavaScript/TypeScript file"""
         # Extract function names
-        func_patterns = [
-            r"function\s+(\w+)\s*\(",
-            r"const\s+(\w+)\s*=\s*(?:async\s*)?\(",
-            r"(?:export\s+)?(?:async\s+)?function\s+(\w+)",
-            r"(\w+)\s*:\s*(?:async\s*)?\([^)]*\)\s*=>",
-        ]
-
-        for pattern in func_patterns:
-            semantics.entities.extend(re.findall(pattern, content))
+        for pattern in _JS_FUNC_RES:
+            semantics.entities.extend(pattern.findall(content))
 
         # Extract class names
-        class_pattern = r"class\s+(\w+)"
-        semantics.entities.extend(re.findall(class_pattern, content))
+        semantics.entities.extend(_JS_CLASS_RE.findall(content))
 
         # Extract JSDoc comments
-        jsdoc_pattern = r"/\*\*(.*?)\*/"
-        jsdocs = re.findall(jsdoc_pattern, content, re.DOTALL)
+        jsdocs = _JSDOC_RE.findall(content)
 
         # Extract single-line comments
-        comment_pattern = r"//\s*(.+)$"
-        comments = re.findall(comment_pattern, content, re.MULTILINE)
+        comments = _JS_COMMENT_RE.findall(content)
 
         full_text = (
             f"{' '.join(jsdocs)} {' '.join(comments)} {' '.join(semantics.entities)}"
@@ -379,13 +423,11 @@ class SemanticAnalyzer:
     def _analyze_markdown(self, content: str, semantics: FileSemantics):
         """Analyze Markdown file"""
         # Extract headings
-        heading_pattern = r"^#+\s+(.+)$"
-        headings = re.findall(heading_pattern, content, re.MULTILINE)
-        semantics.entities.extend(headings)
+        semantics.entities.extend(_MD_HEADING_RE.findall(content))
 
         # Remove code blocks for text analysis
-        content_no_code = re.sub(r"```.*?```", "", content, flags=re.DOTALL)
-        content_no_code = re.sub(r"`[^`]+`", "", content_no_code)
+        content_no_code = _MD_CODE_BLOCK_RE.sub("", content)
+        content_no_code = _MD_INLINE_CODE_RE.sub("", content_no_code)
 
         semantics.word_freq = self._extract_word_freq(content_no_code)
 
@@ -469,11 +511,11 @@ class SemanticAnalyzer:
         text = text.lower()
 
         # Split camelCase and snake_case
-        text = re.sub(r"([a-z])([A-Z])", r"\1 \2", text)
+        text = _CAMEL_RE.sub(r"\1 \2", text)
         text = text.replace("_", " ").replace("-", " ")
 
         # Extract words
-        words = re.findall(r"\b[a-z]{3,}\b", text)
+        words = _WORD_RE.findall(text)
 
         # Filter stop words and noise
         words = [
@@ -484,51 +526,110 @@ class SemanticAnalyzer:
 
     def _extract_topics(self, content: str) -> list[str]:
         """Extract topics from content using pattern matching"""
-        content_lower = content.lower()
-        topics = []
+        if _TOPIC_DB is not None:
+            # Hyperscan streams the buffer through a DFA covering all
+            # patterns at once; case folding happens in the matcher
+            hits: set[int] = set()
+
+            def _on_match(pat_id, _start, _end, _flags, _ctx):
+                hits.add(pat_id)
 
-        for topic, pattern in self.TOPIC_PATTERNS.items():
-            if re.search(pattern, content_lower):
-                topics.append(topic)
+            _TOPIC_DB.scan(
+                content.encode("utf-8", "ignore"), match_event_handler=_on_match
+            )
+            return [topic for i, topic in enumerate(_TOPIC_NAMES) if i in hits]
+
+        content_lower = content.lower()
 
-        return topics
+        # One search per topic against the precompiled patterns. The
+        # vocabularies overlap (e.g. "query" is both database and
+        # search), so every pattern must get its own pass; a merged
+        # alternation would credit each hit to one topic only
+        return [
+            topic
+            for topic, pattern in _TOPIC_PATTERNS
+            if pattern.search(content_lower)
+        ]
 
     def _calculate_tfidf(self):
         """Calculate TF-IDF scores for all documents"""
+        # IDF depends only on the word, so compute it once per corpus
+        # word instead of once per (file, word) pair
+        docs_plus_one = self.total_docs + 1
+        self.idf = {
+            word: math.log(docs_plus_one / (df + 1))
+            for word, df in self.document_freq.items()
+        }
+
         for path, semantics in self.file_semantics.items():
             total_words = sum(semantics.word_freq.values()) or 1
 
+            idf = self.idf
             for word, freq in semantics.word_freq.items():
-                tf = freq / total_words
-                idf = math.log((self.total_docs + 1) / (self.document_freq[word] + 1))
-                semantics.tf_idf[word] = tf * idf
+                semantics.tf_idf[word] = (freq / total_words) * idf[word]
+
+            # The vector magnitude is a per-file constant; cache it,
+            # then scale the vector to unit length so the similarity
+            # sweep's dot product is the cosine directly
+            semantics.norm = math.sqrt(sum(v * v for v in semantics.tf_idf.values()))
+            if semantics.norm:
+                inv_norm = 1.0 / semantics.norm
+                for word in semantics.tf_idf:
+                    semantics.tf_idf[word] *= inv_norm
+
+            # Extract top keywords by TF-IDF; a bounded heap selection
+            # beats sorting the whole vocabulary per file
+            semantics.keywords = [
+                word
+                for word, score in heapq.nlargest(
+                    30, semantics.tf_idf.items(), key=lambda x: x[1]
+                )
+            ]
 
-            # Extract top keywords by TF-IDF
-            sorted_keywords = sorted(
-                semantics.tf_idf.items(), key=lambda x: x[1], reverse=True
-            )
-            semantics.keywords = [word for word, score in sorted_keywords[:30]]
+    def _compute_pairwise_similarities(self) -> dict[tuple[str, str], float]:
+        """Compute cosine similarity for every file pair in one sweep.
 
-    def _cosine_similarity(self, sem1: FileSemantics, sem2: FileSemantics) -> float:
-        """Calculate cosine similarity between two files"""
-        words1 = set(sem1.tf_idf.keys())
-        words2 = set(sem2.tf_idf.keys())
+        _get_semantic_links runs once per file, so computing scores on
+        demand would repeat the full pairwise pass N times. One upfront
+        sweep stores each pair's score once; zero scores are left out
+        so the cache stays sparse.
+        """
+        items = list(self.file_semantics.items())
+        sims: dict[tuple[str, str], float] = {}
+        cosine = self._cosine_similarity
 
-        common_words = words1 & words2
-        if not common_words:
-            return 0.0
+        for i, (path1, sem1) in enumerate(items):
+            for path2, sem2 in items[i + 1 :]:
+                score = cosine(sem1, sem2)
+                if score > 0.0:
+                    key = (path1, path2) if path1 < path2 else (path2, path1)
+                    sims[key] = score
 
-        # Calculate dot product
-        dot_product = sum(sem1.tf_idf[w] * sem2.tf_idf[w] for w in common_words)
+        return sims
 
-        # Calculate magnitudes
-        mag1 = math.sqrt(sum(v**2 for v in sem1.tf_idf.values()))
-        mag2 = math.sqrt(sum(v**2 for v in sem2.tf_idf.values()))
+    def _similarity(self, path1: str, path2: str) -> float:
+        """Look up the precomputed cosine similarity for a file pair"""
+        if path1 > path2:
+            path1, path2 = path2, path1
+        return self._sims.get((path1, path2), 0.0)
 
-        if mag1 == 0 or mag2 == 0:
+    def _cosine_similarity(self, sem1: FileSemantics, sem2: FileSemantics) -> float:
+        """Calculate cosine similarity between two files.
+
+        TF-IDF vectors are unit-normalized when computed, so the dot
+        product over shared words already is the cosine. Walking the
+        smaller vector with .get on the larger skips materializing the
+        key-set intersection.
+        """
+        v1 = sem1.tf_idf
+        v2 = sem2.tf_idf
+        if len(v1) > len(v2):
+            v1, v2 = v2, v1
+        if not v1:
             return 0.0
 
-        return dot_product / (mag1 * mag2)
+        get = v2.get
+        return sum(weight * get(word, 0.0) for word, weight in v1.items())
 
     def _topic_overlap(self, sem1: FileSemantics, sem2: FileSemantics) -> float:
         """Calculate topic overlap between two files"""
@@ -552,7 +653,7 @@ class SemanticAnalyzer:
             if other_path == file_path:
                 continue
 
-            similarity = self._cosine_similarity(source_sem, other_sem)
+            similarity = self._similarity(file_path, other_path)
             topic_overlap = self._topic_overlap(source_sem, other_sem)
 
             # Combined score
@@ -594,7 +695,7 @@ class SemanticAnalyzer:
                 if other_path in assigned:
                     continue
 
-                similarity = self._cosine_similarity(semantics, other_sem)
+                similarity = self._similarity(path, other_path)
                 topic_overlap = self._topic_overlap(semantics, other_sem)
 
                 if similarity > 0.5 or topic_overlap > 0.5:
@@ -647,7 +748,7 @@ class SemanticAnalyzer:
                 name_match = doc_name in code_name or code_name in doc_name
 
                 # Check semantic similarity
-                similarity = self._cosine_similarity(doc_sem, code_sem)
+                similarity = self._similarity(doc_path, code_path)
 
                 # Check entity mentions
                 entity_mentions = sum(
@@ -704,35 +805,57 @@ class SemanticAnalyzer:
         return links
 
     def _detect_duplicates(self) -> list[dict]:
-        """Detect potential duplicate files"""
+        """Detect potential duplicate files.
+
+        Candidate pairs come from a banded MinHash index over each
+        file's token set: near-identical files collide in at least one
+        band, so only those pairs pay for the exact cosine check instead
+        of all N^2 combinations. Files with no tokens can never clear
+        the 0.85 threshold and are skipped outright.
+        """
+        files = [(p, s) for p, s in self.file_semantics.items() if s.word_freq]
+
+        buckets: dict[tuple, list[int]] = {}
+        for idx, (_path, sem) in enumerate(files):
+            token_hashes = [_stable_hash64(t) for t in sem.word_freq]
+            signature = [
+                min(((h ^ salt) * 0x9E3779B97F4A7C15) & _HASH_MASK for h in token_hashes)
+                for salt in _MINHASH_SALTS
+            ]
+            for band in range(_LSH_BANDS):
+                start = band * _LSH_ROWS
+                key = (band, tuple(signature[start : start + _LSH_ROWS]))
+                buckets.setdefault(key, []).append(idx)
+
+        candidate_pairs: set[tuple[int, int]] = set()
+        for members in buckets.values():
+            if len(members) > 1:
+                for i, a in enumerate(members):
+                    for b in members[i + 1 :]:
+                        candidate_pairs.add((a, b))
+
         duplicates = []
         checked = set()
 
-        files = list(self.file_semantics.items())
-
-        for i, (path1, sem1) in enumerate(files):
-            if path1 in checked:
+        for i, j in sorted(candidate_pairs):
+            path1, sem1 = files[i]
+            path2, sem2 = files[j]
+            if path1 in checked or path2 in checked:
                 continue
 
-            for path2, sem2 in files[i + 1 :]:
-                if path2 in checked:
-                    continue
+            # High similarity threshold for duplicates
+            similarity = self._similarity(path1, path2)
 
-                # High similarity threshold for duplicates
-                similarity = self._cosine_similarity(sem1, sem2)
-
-                if similarity > 0.85:
-                    # Check if same file type
-                    if sem1.file_type == sem2.file_type:
-                        duplicates.append(
-                            {
-                                "file1": path1,
-                                "file2": path2,
-                                "similarity": round(similarity, 3),
-                                "file_type": sem1.file_type,
-                            }
-                        )
-                        checked.add(path2)
+            if similarity > 0.85 and sem1.file_type == sem2.file_type:
+                duplicates.append(
+                    {
+                        "file1": path1,
+                        "file2": path2,
+                        "similarity": round(similarity, 3),
+                        "file_type": sem1.file_type,
+                    }
+                )
+                checked.add(path2)
 
         return duplicates
 
@@ -761,6 +884,48 @@ class SemanticAnalyzer:
         return warnings
 
 
+# Topic patterns compiled once at import instead of once per call.
+# Each topic keeps its own pattern because their vocabularies overlap
+# ("query" is both database and search, "model" both database and ai);
+# a file matching several topics must be credited with all of them.
+_TOPIC_PATTERNS = [
+    (topic, re.compile(pattern))
+    for topic, pattern in SemanticAnalyzer.TOPIC_PATTERNS.items()
+]
+
+_TOPIC_NAMES = list(SemanticAnalyzer.TOPIC_PATTERNS)
+
+
+def _build_topic_db():
+    """Compile the topic patterns into a Hyperscan database.
+
+    Hyperscan matches every pattern in one DFA pass over the buffer;
+    HS_FLAG_SINGLEMATCH reports each topic at most once. Returns None
+    when the library is missing or compilation fails, in which case
+    _extract_topics stays on the combined re scan.
+    """
+    if hyperscan is None:
+        return None
+    try:
+        db = hyperscan.Database()
+        flag = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH
+        db.compile(
+            expressions=[
+                pattern.encode()
+                for pattern in SemanticAnalyzer.TOPIC_PATTERNS.values()
+            ],
+            ids=list(range(len(_TOPIC_NAMES))),
+            flags=[flag] * len(_TOPIC_NAMES),
+        )
+        return db
+    except Exception:
+        logger.debug("Hyperscan topic database unavailable", exc_info=True)
+        return None
+
+
+_TOPIC_DB = _build_topic_db()
+
+
 if __name__ == "__main__":
     import sys
 
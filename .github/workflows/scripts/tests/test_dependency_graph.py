@@ -0,0 +1,50 @@
+"""Regression tests for the dependency graph import collector"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from dependency_graph import _analyze_python_imports  # noqa: E402
+
+
+def _imports(source: str) -> set[str]:
+    return _analyze_python_imports(Path("pkg/mod.py"), source.encode())
+
+
+def test_collects_import_in_except_handler():
+    # The try/except-ImportError fallback import is a common pattern;
+    # handlers are not stmt subclasses, so the walker must descend into
+    # them explicitly
+    source = (
+        "try:\n"
+        "    import orjson\n"
+        "except ImportError:\n"
+        "    import simplejson\n"
+    )
+    imports = _imports(source)
+    assert "orjson" in imports
+    assert "simplejson" in imports
+
+
+def test_collects_import_in_match_case():
+    source = (
+        "match value:\n"
+        "    case 1:\n"
+        "        import json\n"
+        "    case _:\n"
+        "        import pickle\n"
+    )
+    imports = _imports(source)
+    assert "json" in imports
+    assert "pickle" in imports
+
+
+def test_collects_import_nested_in_function_and_loop():
+    source = (
+        "def f():\n"
+        "    for _ in range(2):\n"
+        "        if True:\n"
+        "            import csv\n"
+    )
+    assert "csv" in _imports(source)
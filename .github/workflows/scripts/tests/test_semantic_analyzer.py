@@ -0,0 +1,62 @@
+"""Regression tests for topic extraction"""
+
+import re
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import semantic_analyzer  # noqa: E402
+from semantic_analyzer import SemanticAnalyzer  # noqa: E402
+
+# Inputs chosen to hit the overlapping topic vocabularies: "query" is
+# both database and search, "model" both database and ai, and match/
+# index/event/log collide across topics as well
+OVERLAPPING_SAMPLES = [
+    "run the query now",
+    "train the model on the table schema",
+    "match the index against the event log",
+    "login with the api token and run the sql query",
+    "nothing relevant here at all",
+]
+
+
+def _reference_topics(content: str) -> list[str]:
+    """The original per-topic re.search loop, kept as the oracle"""
+    content_lower = content.lower()
+    return [
+        topic
+        for topic, pattern in SemanticAnalyzer.TOPIC_PATTERNS.items()
+        if re.search(pattern, content_lower)
+    ]
+
+
+def test_overlapping_vocabulary_credits_all_topics():
+    analyzer = SemanticAnalyzer(".")
+    assert analyzer._extract_topics("run the query now") == ["database", "search"]
+
+
+def test_topic_extraction_matches_reference():
+    analyzer = SemanticAnalyzer(".")
+    for sample in OVERLAPPING_SAMPLES:
+        assert analyzer._extract_topics(sample) == _reference_topics(sample)
+
+
+def test_hyperscan_and_re_paths_agree():
+    # The hyperscan fast path and the re fallback must produce the same
+    # topic sets; when hyperscan is not installed only the fallback runs
+    # and the reference comparison above already covers it
+    if semantic_analyzer._TOPIC_DB is None:
+        return
+
+    analyzer = SemanticAnalyzer(".")
+    db = semantic_analyzer._TOPIC_DB
+    try:
+        for sample in OVERLAPPING_SAMPLES:
+            fast = analyzer._extract_topics(sample)
+            semantic_analyzer._TOPIC_DB = None
+            fallback = analyzer._extract_topics(sample)
+            semantic_analyzer._TOPIC_DB = db
+            assert fast == fallback
+    finally:
+        semantic_analyzer._TOPIC_DB = db